@@ -1,6 +1,7 @@
 """Service for managing map state and operations."""
 
-from typing import Any, List, Optional
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import geopandas as gpd
@@ -8,8 +9,10 @@ try:
 except ImportError:
     GEOPANDAS_AVAILABLE = False
 
-from shapely.geometry import LineString
-from pyproj import Transformer
+import numpy as np
+import shapely
+from shapely.geometry import LineString, box
+from shapely.strtree import STRtree
 
 from geo_tui.domain.entities.map_data import MapPoint, MapDataUpdate
 from geo_tui.domain.entities.viewport import Viewport
@@ -17,6 +20,25 @@ from geo_tui.domain.interfaces.geometry_loader import GeometryLoader
 from geo_tui.domain.interfaces.projection import Projection
 from geo_tui.domain.interfaces.renderer import Renderer
 
+# Updates closer than this many degrees in both axes replace the existing point
+_POINT_MATCH_TOLERANCE = 1e-4
+
+# Points are indexed on a grid of tolerance-sized cells, so a match is always
+# in the same or a neighbouring cell
+_POINT_KEY_SCALE = 1 / _POINT_MATCH_TOLERANCE
+
+# Culling lines against the viewport only pays off for larger line sets
+_LINE_CULL_MIN_LINES = 256
+
+# From this many lines an STRtree query beats the linear bounding-box mask
+_LINE_TREE_MIN_LINES = 10_000
+
+# Initial row capacity of the projected point array
+_POINT_ARRAY_MIN_CAPACITY = 64
+
+# Below this many points a vectorized bounds check beats building an STRtree
+_POINT_TREE_MIN_POINTS = 10_000
+
 
 class MapService:
     """Service for managing map operations."""
@@ -39,30 +61,61 @@ class MapService:
         self.renderer = renderer
         self._geometries: Any = None
         self._projected_geometries: Any = None
+        # Flat projected vertices of the manually projected lines, with the
+        # start offset of each line (plus a final end offset)
+        self._line_coords: Optional[np.ndarray] = None
+        self._line_offsets: Optional[np.ndarray] = None
+        # Per-line (minx, miny, maxx, maxy), NaN for empty lines
+        self._line_bounds: Optional[np.ndarray] = None
+        self._line_tree: Optional[STRtree] = None
         self._points: List[MapPoint] = []
-        self._projector = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+        # Grid cell -> indices of the points in it, in insertion order
+        self._point_index: Dict[Tuple[int, int], List[int]] = {}
+        # Projected (x, y) per point, parallel to _points; grown by doubling
+        self._points_xy = np.empty((_POINT_ARRAY_MIN_CAPACITY, 2), dtype=np.float64)
+        self._points_tree: Optional[STRtree] = None
+        # Bumped whenever the point set changes, to invalidate cached renders
+        self._points_version = 0
+        # (render key, rendered string) of the last render
+        self._last_render: Optional[Tuple[tuple, str]] = None
     
     def load_geometries(self) -> None:
         """Load and project geometries."""
         geometries = self.geometry_loader.load()
         self._geometries = geometries
+        self._line_coords = None
+        self._line_offsets = None
+        self._line_bounds = None
+        self._line_tree = None
+        self._last_render = None
         
         # Project to Web Mercator
         if GEOPANDAS_AVAILABLE and isinstance(geometries, gpd.GeoSeries):
             # Use GeoPandas projection
             self._projected_geometries = geometries.to_crs("EPSG:3857")
         else:
-            # Project list of LineStrings manually
-            projected_lines = []
-            for line in geometries:
-                if isinstance(line, LineString):
-                    # Transform coordinates
-                    coords = list(line.coords)
-                    projected_coords = [
-                        self._projector.transform(lon, lat) for lon, lat in coords
-                    ]
-                    projected_lines.append(LineString(projected_coords))
-            self._projected_geometries = projected_lines
+            # Validate the loader's output once, with a vectorized type check
+            lines = np.array(geometries, dtype=object)
+            is_line = shapely.get_type_id(lines) == shapely.GeometryType.LINESTRING
+            if not is_line.all():
+                lines = lines[is_line]
+            all_coords = shapely.get_coordinates(lines)
+            offsets = np.concatenate(([0], np.cumsum(shapely.get_num_coordinates(lines))))
+            
+            # Project list of LineStrings manually, batching every vertex
+            # into a single transform call
+            px, py = self.projection.project(all_coords[:, 0], all_coords[:, 1])
+            coords = np.column_stack([px, py])
+            
+            self._line_coords = coords
+            self._line_offsets = offsets
+            self._projected_geometries = [
+                LineString(coords[start:end])
+                for start, end in zip(offsets[:-1], offsets[1:])
+            ]
+            self._line_bounds = shapely.bounds(self._projected_geometries)
+            if len(self._projected_geometries) >= _LINE_TREE_MIN_LINES:
+                self._line_tree = STRtree(self._projected_geometries)
     
     def get_geometries(self) -> Any:
         """Get the loaded geometries.
@@ -72,6 +125,18 @@ class MapService:
         """
         return self._projected_geometries
     
+    def geometries_as_arrays(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Get the projected lines as flat coordinate arrays.
+        
+        Returns:
+            Tuple of (coords, offsets) where coords is an (N, 2) array of all
+            vertices and line i spans coords[offsets[i]:offsets[i + 1]], or
+            None if geometries are not loaded as lines
+        """
+        if self._line_coords is None:
+            return None
+        return (self._line_coords, self._line_offsets)
+    
     def get_geometry_bounds(self) -> Optional[tuple]:
         """Get the bounds of the loaded geometries in projected coordinates.
         
@@ -86,23 +151,13 @@ class MapService:
             bounds = self._projected_geometries.total_bounds
             return (bounds[0], bounds[1], bounds[2], bounds[3])
         else:
-            # Calculate bounds from list of LineStrings
-            if not self._projected_geometries:
+            # Calculate bounds from the flat coordinate array
+            if self._line_coords is None or not len(self._line_coords):
                 return None
             
-            # Get all coordinates
-            all_coords = []
-            for geom in self._projected_geometries:
-                if isinstance(geom, LineString):
-                    all_coords.extend(geom.coords)
-            
-            if not all_coords:
-                return None
-            
-            # Calculate bounds
-            xs = [x for x, y in all_coords]
-            ys = [y for x, y in all_coords]
-            return (min(xs), min(ys), max(xs), max(ys))
+            minx, miny = self._line_coords.min(axis=0)
+            maxx, maxy = self._line_coords.max(axis=0)
+            return (float(minx), float(miny), float(maxx), float(maxy))
     
     def add_point(self, point: MapPoint) -> None:
         """Add a point to the map.
@@ -110,7 +165,35 @@ class MapService:
         Args:
             point: Point to add
         """
-        self._points.append(point)
+        self._point_index.setdefault(self._point_key(point), []).append(len(self._points))
+        self._append_point(point)
+    
+    def bulk_add_points(self, points: List[MapPoint]) -> None:
+        """Add many points to the map at once.
+        
+        Equivalent to calling add_point for each point, but projects all
+        points in a single call.
+        
+        Args:
+            points: Points to add
+        """
+        if not points:
+            return
+        
+        start = len(self._points)
+        count = len(points)
+        self._reserve_points(start + count)
+        
+        lons = np.fromiter((point.longitude for point in points), dtype=np.float64, count=count)
+        lats = np.fromiter((point.latitude for point in points), dtype=np.float64, count=count)
+        xs, ys = self.projection.project(lons, lats)
+        self._points_xy[start:start + count, 0] = xs
+        self._points_xy[start:start + count, 1] = ys
+        
+        for index, point in enumerate(points, start):
+            self._point_index.setdefault(self._point_key(point), []).append(index)
+        self._points.extend(points)
+        self._points_changed()
     
     def update_map_data(self, update: MapDataUpdate) -> None:
         """Update map data at a specific location.
@@ -120,12 +203,23 @@ class MapService:
         """
         point = update.to_point()
         # Check if point already exists and update, or add new
-        for i, existing_point in enumerate(self._points):
-            if (abs(existing_point.longitude - point.longitude) < 0.0001 and
-                abs(existing_point.latitude - point.latitude) < 0.0001):
-                self._points[i] = point
-                return
-        self._points.append(point)
+        key = self._point_key(point)
+        index = self._find_point(point)
+        if index is not None:
+            old_key = self._point_key(self._points[index])
+            if old_key != key:
+                # The replacement may fall into a neighbouring cell
+                old_cell = self._point_index[old_key]
+                old_cell.remove(index)
+                if not old_cell:
+                    del self._point_index[old_key]
+                bisect.insort(self._point_index.setdefault(key, []), index)
+            self._points[index] = point
+            self._points_xy[index] = self.projection.project(point.longitude, point.latitude)
+            self._points_changed()
+            return
+        self._point_index.setdefault(key, []).append(len(self._points))
+        self._append_point(point)
     
     def get_points(self) -> List[MapPoint]:
         """Get all points on the map.
@@ -138,6 +232,75 @@ class MapService:
     def clear_points(self) -> None:
         """Clear all points from the map."""
         self._points.clear()
+        self._point_index.clear()
+        self._points_changed()
+    
+    def _append_point(self, point: MapPoint) -> None:
+        """Append a point and its projected coordinates.
+        
+        Args:
+            point: Point to append
+        """
+        count = len(self._points)
+        self._reserve_points(count + 1)
+        self._points_xy[count] = self.projection.project(point.longitude, point.latitude)
+        self._points.append(point)
+        self._points_changed()
+    
+    def _reserve_points(self, capacity: int) -> None:
+        """Grow the projected point array to hold at least capacity points.
+        
+        Args:
+            capacity: Number of points the array must hold
+        """
+        size = len(self._points_xy)
+        if capacity <= size:
+            return
+        while size < capacity:
+            size *= 2
+        grown = np.empty((size, 2), dtype=np.float64)
+        grown[:len(self._points)] = self._points_xy[:len(self._points)]
+        self._points_xy = grown
+    
+    def _points_changed(self) -> None:
+        """Invalidate state derived from the point set."""
+        self._points_tree = None
+        self._points_version += 1
+    
+    def _find_point(self, point: MapPoint) -> Optional[int]:
+        """Find the first point within the match tolerance of a location.
+        
+        Args:
+            point: Point whose location to look up
+            
+        Returns:
+            Index of the earliest matching point, or None if there is none
+        """
+        key_x, key_y = self._point_key(point)
+        matches = [
+            index
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            for index in self._point_index.get((key_x + dx, key_y + dy), ())
+            if abs(self._points[index].longitude - point.longitude) < _POINT_MATCH_TOLERANCE
+            and abs(self._points[index].latitude - point.latitude) < _POINT_MATCH_TOLERANCE
+        ]
+        return min(matches, default=None)
+    
+    @staticmethod
+    def _point_key(point: MapPoint) -> Tuple[int, int]:
+        """Get the grid cell a point is indexed under.
+        
+        Args:
+            point: Point to key
+            
+        Returns:
+            Tuple of quantized (longitude, latitude)
+        """
+        return (
+            round(point.longitude * _POINT_KEY_SCALE),
+            round(point.latitude * _POINT_KEY_SCALE),
+        )
     
     def render(
         self,
@@ -158,16 +321,64 @@ class MapService:
         if self._projected_geometries is None:
             return ""
         
+        # Nothing changed since the last render, reuse its output
+        render_key = (
+            viewport.center_x,
+            viewport.center_y,
+            viewport.meters_per_pixel,
+            width,
+            height,
+            self._points_version,
+        )
+        if self._last_render is not None and self._last_render[0] == render_key:
+            return self._last_render[1]
+        
         # Filter points by viewport
         visible_points = self._get_visible_points(viewport, width, height)
         
-        return self.renderer.render(
+        geometries = self._projected_geometries
+        if self._line_bounds is not None and len(self._line_bounds) > _LINE_CULL_MIN_LINES:
+            geometries = [
+                geometries[i] for i in self._get_visible_lines(viewport, width, height)
+            ]
+        
+        rendered = self.renderer.render(
             viewport=viewport,
-            geometries=self._projected_geometries,
+            geometries=geometries,
             width=width,
             height=height,
             points=visible_points
         )
+        self._last_render = (render_key, rendered)
+        return rendered
+    
+    def _get_visible_lines(
+        self,
+        viewport: Viewport,
+        width: int,
+        height: int
+    ) -> np.ndarray:
+        """Get indices of lines whose bounding boxes overlap the viewport.
+        
+        Args:
+            viewport: Current viewport
+            width: Display width
+            height: Display height
+            
+        Returns:
+            Array of line indices
+        """
+        minx, miny, maxx, maxy = viewport.get_bounds(width * 2, height * 4)
+        
+        if self._line_tree is not None:
+            return np.sort(self._line_tree.query(box(minx, miny, maxx, maxy)))
+        
+        bounds = self._line_bounds
+        mask = (
+            (bounds[:, 2] >= minx) & (bounds[:, 0] <= maxx) &
+            (bounds[:, 3] >= miny) & (bounds[:, 1] <= maxy)
+        )
+        return np.flatnonzero(mask)
     
     def _get_visible_points(
         self,
@@ -188,13 +399,20 @@ class MapService:
         if not self._points:
             return []
         
+        # Points are projected on insert, so no projection happens per frame
+        points_xy = self._points_xy[:len(self._points)]
         minx, miny, maxx, maxy = viewport.get_bounds(width * 2, height * 4)
-        visible = []
         
-        for point in self._points:
-            x, y = self.projection.project(point.longitude, point.latitude)
-            if minx <= x <= maxx and miny <= y <= maxy:
-                visible.append(point)
+        if len(self._points) >= _POINT_TREE_MIN_POINTS:
+            if self._points_tree is None:
+                # Rebuilt lazily after the point set changes
+                self._points_tree = STRtree(shapely.points(points_xy))
+            indices = np.sort(self._points_tree.query(box(minx, miny, maxx, maxy)))
+        else:
+            xs = points_xy[:, 0]
+            ys = points_xy[:, 1]
+            mask = (xs >= minx) & (xs <= maxx) & (ys >= miny) & (ys <= maxy)
+            indices = np.flatnonzero(mask)
         
-        return visible
+        return [self._points[i] for i in indices]
 
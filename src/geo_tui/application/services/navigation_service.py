@@ -1,5 +1,7 @@
 """Service for map navigation operations."""
 
+from typing import Optional, Tuple
+
 from geo_tui.domain.entities.viewport import Viewport
 
 
@@ -13,6 +15,22 @@ class NavigationService:
             viewport: Viewport to control
         """
         self.viewport = viewport
+        # Display size in characters, estimated until set_viewport_size is called
+        self._width = 100
+        self._height = 100
+        # (meters_per_pixel, span_x, span_y) for the current display size
+        self._pan_spans: Optional[Tuple[float, float, float]] = None
+    
+    def set_viewport_size(self, width: int, height: int) -> None:
+        """Set the size of the displayed map.
+        
+        Args:
+            width: Display width in characters
+            height: Display height in characters
+        """
+        self._width = width
+        self._height = height
+        self._pan_spans = None
     
     def pan_left(self, step: float = 0.2) -> None:
         """Pan the map left.
@@ -20,9 +38,7 @@ class NavigationService:
         Args:
             step: Fraction of screen width to pan (default 0.2 = 20%)
         """
-        width_px = 100 * 2  # Estimate, will be updated by actual size
-        span_x = width_px * self.viewport.meters_per_pixel
-        self.viewport.pan(-step * span_x, 0)
+        self._pan_by_fraction(-step, 0.0)
     
     def pan_right(self, step: float = 0.2) -> None:
         """Pan the map right.
@@ -30,9 +46,7 @@ class NavigationService:
         Args:
             step: Fraction of screen width to pan
         """
-        width_px = 100 * 2
-        span_x = width_px * self.viewport.meters_per_pixel
-        self.viewport.pan(step * span_x, 0)
+        self._pan_by_fraction(step, 0.0)
     
     def pan_up(self, step: float = 0.2) -> None:
         """Pan the map up.
@@ -40,9 +54,7 @@ class NavigationService:
         Args:
             step: Fraction of screen height to pan
         """
-        height_px = 100 * 4
-        span_y = height_px * self.viewport.meters_per_pixel
-        self.viewport.pan(0, step * span_y)
+        self._pan_by_fraction(0.0, step)
     
     def pan_down(self, step: float = 0.2) -> None:
         """Pan the map down.
@@ -50,9 +62,26 @@ class NavigationService:
         Args:
             step: Fraction of screen height to pan
         """
-        height_px = 100 * 4
-        span_y = height_px * self.viewport.meters_per_pixel
-        self.viewport.pan(0, -step * span_y)
+        self._pan_by_fraction(0.0, -step)
+    
+    def _pan_by_fraction(self, fraction_x: float, fraction_y: float) -> None:
+        """Pan the map by fractions of the screen size.
+        
+        Args:
+            fraction_x: Fraction of screen width to pan (negative pans left)
+            fraction_y: Fraction of screen height to pan (negative pans down)
+        """
+        meters_per_pixel = self.viewport.meters_per_pixel
+        spans = self._pan_spans
+        if spans is None or spans[0] != meters_per_pixel:
+            # Screen span in projected units; braille cells are 2x4 subpixels
+            spans = (
+                meters_per_pixel,
+                self._width * 2 * meters_per_pixel,
+                self._height * 4 * meters_per_pixel,
+            )
+            self._pan_spans = spans
+        self.viewport.pan(fraction_x * spans[1], fraction_y * spans[2])
     
     def pan(self, delta_x: float, delta_y: float) -> None:
         """Pan the map by the given deltas.
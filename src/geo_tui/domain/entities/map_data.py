@@ -4,7 +4,24 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+def _validate_coordinates(longitude: float, latitude: float) -> None:
+    """Validate WGS84 coordinates.
+    
+    Args:
+        longitude: Longitude in degrees
+        latitude: Latitude in degrees
+        
+    Raises:
+        ValueError: If either coordinate is out of range
+    """
+    if -180 <= longitude <= 180 and -90 <= latitude <= 90:
+        return
+    if not -180 <= longitude <= 180:
+        raise ValueError(f"Longitude must be between -180 and 180, got {longitude}")
+    raise ValueError(f"Latitude must be between -90 and 90, got {latitude}")
+
+
+@dataclass(slots=True)
 class MapPoint:
     """Represents a point on the map with associated data."""
     
@@ -19,13 +36,33 @@ class MapPoint:
     
     def __post_init__(self):
         """Validate coordinates."""
-        if not -180 <= self.longitude <= 180:
-            raise ValueError(f"Longitude must be between -180 and 180, got {self.longitude}")
-        if not -90 <= self.latitude <= 90:
-            raise ValueError(f"Latitude must be between -90 and 90, got {self.latitude}")
+        _validate_coordinates(self.longitude, self.latitude)
+    
+    @classmethod
+    def _unchecked(
+        cls,
+        longitude: float,
+        latitude: float,
+        data: Optional[Dict[str, Any]] = None
+    ) -> "MapPoint":
+        """Create a point from coordinates that are already validated.
+        
+        Args:
+            longitude: Longitude in degrees (WGS84)
+            latitude: Latitude in degrees (WGS84)
+            data: Optional data associated with this point
+            
+        Returns:
+            New MapPoint, without running validation
+        """
+        point = object.__new__(cls)
+        point.longitude = longitude
+        point.latitude = latitude
+        point.data = data
+        return point
 
 
-@dataclass
+@dataclass(slots=True)
 class MapDataUpdate:
     """Represents an update to map data at a specific location."""
     
@@ -38,11 +75,14 @@ class MapDataUpdate:
     data: Dict[str, Any]
     """Data to associate with this location."""
     
+    def __post_init__(self):
+        """Validate coordinates."""
+        _validate_coordinates(self.longitude, self.latitude)
+    
     def to_point(self) -> MapPoint:
         """Convert to a MapPoint."""
-        return MapPoint(
+        return MapPoint._unchecked(
             longitude=self.longitude,
             latitude=self.latitude,
             data=self.data
         )
-
@@ -1,10 +1,10 @@
 """Viewport entity representing the current map view."""
 
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Viewport:
     """Represents the current viewport of the map.
     
@@ -21,6 +21,11 @@ class Viewport:
     meters_per_pixel: float
     """Scale factor: meters per pixel at current zoom level."""
     
+    _bounds_cache: Optional[Tuple[tuple, Tuple[float, float, float, float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Last computed bounds and the (center, zoom, pixel size) key they were computed for."""
+    
     def get_bounds(self, width_px: int, height_px: int) -> Tuple[float, float, float, float]:
         """Calculate viewport bounds in projected coordinates.
         
@@ -31,6 +36,12 @@ class Viewport:
         Returns:
             Tuple of (minx, miny, maxx, maxy) in projected coordinates
         """
+        # Keyed by value so direct attribute assignment can't leave stale bounds
+        key = (self.center_x, self.center_y, self.meters_per_pixel, width_px, height_px)
+        cache = self._bounds_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        
         half_width_m = (width_px * self.meters_per_pixel) / 2
         half_height_m = (height_px * self.meters_per_pixel) / 2
         
@@ -39,7 +50,9 @@ class Viewport:
         miny = self.center_y - half_height_m
         maxy = self.center_y + half_height_m
         
-        return (minx, miny, maxx, maxy)
+        bounds = (minx, miny, maxx, maxy)
+        self._bounds_cache = (key, bounds)
+        return bounds
     
     def pan(self, delta_x: float, delta_y: float) -> None:
         """Pan the viewport by the given deltas.
@@ -5,7 +5,11 @@ from typing import Tuple
 
 
 class Projection(ABC):
-    """Interface for coordinate projection systems."""
+    """Interface for coordinate projection systems.
+    
+    Implementations accept either scalars or NumPy arrays of coordinates,
+    so many points can be transformed in a single call.
+    """
     
     @abstractmethod
     def project(self, longitude: float, latitude: float) -> Tuple[float, float]:
@@ -29,7 +29,8 @@ class Renderer(ABC):
             points: Optional list of points to highlight
             
         Returns:
-            String representation of the rendered map
+            String representation of the rendered map, with at most height
+            lines of at most width characters each
         """
         pass
 
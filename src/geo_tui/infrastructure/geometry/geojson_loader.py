@@ -1,14 +1,25 @@
 """Simple GeoJSON loader that doesn't require geopandas."""
 
 import json
+import zipfile
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 
-from shapely.geometry import LineString, MultiLineString, Polygon, MultiPolygon, shape
-from shapely.ops import unary_union
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+import numpy as np
+import shapely
+from shapely.geometry import LineString
 
 from geo_tui.domain.interfaces.geometry_loader import GeometryLoader
 
+# Suffix appended to the source path for the parsed-coordinates cache
+_CACHE_SUFFIX = ".npz"
+
 
 class GeoJSONLoader(GeometryLoader):
     """Loads geometries from GeoJSON files without requiring geopandas."""
@@ -34,10 +45,26 @@ class GeoJSONLoader(GeometryLoader):
         if not path.exists():
             raise FileNotFoundError(f"GeoJSON file not found: {path}")
         
-        with open(path, 'r') as f:
-            geojson_data = json.load(f)
+        cache_path = path.with_name(path.name + _CACHE_SUFFIX)
+        lines = _read_cache(path, cache_path)
+        if lines is None:
+            lines = self._parse(path)
+            _write_cache(path, cache_path, lines)
+        return lines
+    
+    def _parse(self, path: Path) -> List[LineString]:
+        """Parse a GeoJSON file into lines.
         
-        lines = []
+        Args:
+            path: Path to GeoJSON file
+            
+        Returns:
+            List of LineString geometries representing coastlines
+        """
+        with open(path, 'rb') as f:
+            raw = f.read()
+        # orjson parses the whole document several times faster than json
+        geojson_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
         
         # Process GeoJSON features
         if geojson_data.get('type') == 'FeatureCollection':
@@ -46,38 +73,105 @@ class GeoJSONLoader(GeometryLoader):
             features = [geojson_data]
         else:
             # Single geometry
-            geom = shape(geojson_data)
-            if isinstance(geom, (Polygon, MultiPolygon)):
-                if isinstance(geom, Polygon):
-                    lines.append(LineString(geom.exterior.coords))
-                else:
-                    for g in geom.geoms:
-                        lines.append(LineString(g.exterior.coords))
-            elif isinstance(geom, (LineString, MultiLineString)):
-                if isinstance(geom, LineString):
-                    lines.append(geom)
-                else:
-                    lines.extend(geom.geoms)
-            return lines
+            return _geometry_lines(geojson_data)
         
         # Process each feature
+        lines = []
         for feature in features:
             geometry = feature.get('geometry')
             if not geometry:
                 continue
-            
-            geom = shape(geometry)
-            
-            # Convert polygons to lines (coastlines)
-            if isinstance(geom, Polygon):
-                lines.append(LineString(geom.exterior.coords))
-            elif isinstance(geom, MultiPolygon):
-                for g in geom.geoms:
-                    lines.append(LineString(g.exterior.coords))
-            elif isinstance(geom, LineString):
-                lines.append(geom)
-            elif isinstance(geom, MultiLineString):
-                lines.extend(geom.geoms)
+            lines.extend(_geometry_lines(geometry))
         
         return lines
 
+
+def _geometry_lines(geometry: dict) -> List[LineString]:
+    """Build lines straight from a GeoJSON geometry's coordinate arrays.
+    
+    Polygons are converted to their exterior rings (coastlines); other
+    geometry types are ignored.
+    
+    Args:
+        geometry: GeoJSON geometry object
+        
+    Returns:
+        List of LineString geometries
+    """
+    geom_type = geometry.get('type')
+    coordinates = geometry.get('coordinates') or []
+    
+    if geom_type == 'Polygon':
+        rings = coordinates[:1]
+    elif geom_type == 'MultiPolygon':
+        rings = [polygon[0] for polygon in coordinates if polygon]
+    elif geom_type == 'LineString':
+        rings = [coordinates]
+    elif geom_type == 'MultiLineString':
+        rings = coordinates
+    else:
+        return []
+    
+    return [LineString(np.asarray(ring, dtype=np.float64)) for ring in rings]
+
+
+def _source_stamp(path: Path) -> np.ndarray:
+    """Get the modification time and size identifying a source file version.
+    
+    Args:
+        path: Source file path
+        
+    Returns:
+        Array of (mtime_ns, size)
+    """
+    stat = path.stat()
+    return np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+
+def _read_cache(path: Path, cache_path: Path) -> Optional[List[LineString]]:
+    """Read lines from the cache if it matches the source file.
+    
+    Args:
+        path: Source GeoJSON path
+        cache_path: Cache file path
+        
+    Returns:
+        List of LineString geometries, or None if the cache is missing or stale
+    """
+    if not cache_path.exists():
+        return None
+    try:
+        with np.load(cache_path) as cache:
+            if not np.array_equal(cache["source"], _source_stamp(path)):
+                return None
+            coords = cache["coords"]
+            offsets = cache["offsets"]
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    
+    return [
+        LineString(coords[start:end])
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+
+
+def _write_cache(path: Path, cache_path: Path, lines: List[LineString]) -> None:
+    """Write lines to the cache as a flat coordinate array plus offsets.
+    
+    Args:
+        path: Source GeoJSON path
+        cache_path: Cache file path
+        lines: Parsed LineString geometries
+    """
+    coords = shapely.get_coordinates(lines)
+    offsets = np.concatenate(([0], np.cumsum(shapely.get_num_coordinates(lines))))
+    try:
+        np.savez_compressed(
+            cache_path,
+            source=_source_stamp(path),
+            coords=coords,
+            offsets=offsets,
+        )
+    except OSError:
+        # Caching is best-effort, e.g. the data directory may be read-only
+        pass
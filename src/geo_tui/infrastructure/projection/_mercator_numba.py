@@ -0,0 +1,64 @@
+"""Compiled Web Mercator forward projection for coordinate arrays.
+
+Uses Numba when the optional ``numba`` dependency is installed and falls
+back to an equivalent NumPy implementation otherwise. The NumPy version
+is always available as ``project_batch_numpy``.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EARTH_RADIUS = 6378137.0
+"""Sphere radius used by Web Mercator, in meters."""
+
+MAX_LATITUDE = 85.0511287798066
+"""Latitude at which Web Mercator's square world ends, in degrees."""
+
+_DEG_TO_RAD = math.pi / 180.0
+
+
+def project_batch_numpy(lon: np.ndarray, lat: np.ndarray):
+    """Project lon/lat arrays to Web Mercator meters.
+    
+    Args:
+        lon: Longitudes in degrees (float64)
+        lat: Latitudes in degrees (float64), clamped to MAX_LATITUDE
+        
+    Returns:
+        Tuple of (x, y) arrays in Web Mercator meters
+    """
+    phi = np.clip(lat, -MAX_LATITUDE, MAX_LATITUDE) * _DEG_TO_RAD
+    x = EARTH_RADIUS * lon * _DEG_TO_RAD
+    y = EARTH_RADIUS * np.log(np.tan(math.pi / 4.0 + phi / 2.0))
+    return x, y
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def project_batch(lon: np.ndarray, lat: np.ndarray):
+        """Project lon/lat arrays to Web Mercator meters.
+        
+        Args:
+            lon: Longitudes in degrees (float64)
+            lat: Latitudes in degrees (float64), clamped to MAX_LATITUDE
+            
+        Returns:
+            Tuple of (x, y) arrays in Web Mercator meters
+        """
+        n = lon.shape[0]
+        x = np.empty(n, dtype=np.float64)
+        y = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            phi = min(max(lat[i], -MAX_LATITUDE), MAX_LATITUDE) * _DEG_TO_RAD
+            x[i] = EARTH_RADIUS * lon[i] * _DEG_TO_RAD
+            y[i] = EARTH_RADIUS * math.log(math.tan(math.pi / 4.0 + phi / 2.0))
+        return x, y
+else:
+    project_batch = project_batch_numpy
@@ -1,47 +1,96 @@
 """Web Mercator projection implementation."""
 
+import math
+import threading
 from typing import Tuple
 
+import numpy as np
 from pyproj import Transformer
 
 from geo_tui.domain.interfaces.projection import Projection
+from geo_tui.infrastructure.projection._mercator_numba import (
+    EARTH_RADIUS,
+    MAX_LATITUDE,
+    project_batch,
+)
+
+_WGS84 = "EPSG:4326"
+_WEB_MERCATOR = "EPSG:3857"
+
+# pyproj transformers must not be shared between threads, so each thread
+# lazily builds and keeps its own
+_local = threading.local()
+
+
+def _get_transformer(source_crs: str, target_crs: str) -> Transformer:
+    """Get the current thread's transformer for a CRS pair.
+    
+    Args:
+        source_crs: Source coordinate reference system
+        target_crs: Target coordinate reference system
+        
+    Returns:
+        Transformer from source_crs to target_crs (always_xy ordering)
+    """
+    transformers = getattr(_local, "transformers", None)
+    if transformers is None:
+        transformers = _local.transformers = {}
+    
+    key = (source_crs, target_crs)
+    transformer = transformers.get(key)
+    if transformer is None:
+        transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
+        transformers[key] = transformer
+    return transformer
+
+
+def _fast_project(longitude: float, latitude: float) -> Tuple[float, float]:
+    """Project a single lon/lat to Web Mercator with the closed-form formula.
+    
+    Args:
+        longitude: Longitude in degrees (WGS84)
+        latitude: Latitude in degrees (WGS84), clamped to MAX_LATITUDE
+        
+    Returns:
+        Tuple of (x, y) in Web Mercator meters
+    """
+    phi = math.radians(min(max(latitude, -MAX_LATITUDE), MAX_LATITUDE))
+    x = EARTH_RADIUS * math.radians(longitude)
+    y = EARTH_RADIUS * math.log(math.tan(math.pi / 4.0 + phi / 2.0))
+    return (x, y)
 
 
 class MercatorProjection(Projection):
     """Web Mercator (EPSG:3857) projection implementation."""
     
-    def __init__(self):
-        """Initialize the projection transformers."""
-        self._to_mercator = Transformer.from_crs(
-            "EPSG:4326", "EPSG:3857", always_xy=True
-        )
-        self._from_mercator = Transformer.from_crs(
-            "EPSG:3857", "EPSG:4326", always_xy=True
-        )
-    
     def project(self, longitude: float, latitude: float) -> Tuple[float, float]:
         """Project lon/lat to Web Mercator meters.
         
         Args:
-            longitude: Longitude in degrees (WGS84)
-            latitude: Latitude in degrees (WGS84)
+            longitude: Longitude in degrees (WGS84), scalar or NumPy array
+            latitude: Latitude in degrees (WGS84), scalar or NumPy array
             
         Returns:
-            Tuple of (x, y) in Web Mercator meters
+            Tuple of (x, y) in Web Mercator meters; latitudes are clamped to
+            Web Mercator's +/-85.0511 degree limit
         """
-        x, y = self._to_mercator.transform(longitude, latitude)
-        return (x, y)
+        # The WGS84 -> Web Mercator case has a closed form, so skip pyproj
+        if isinstance(longitude, np.ndarray):
+            return project_batch(
+                np.ascontiguousarray(longitude, dtype=np.float64),
+                np.ascontiguousarray(latitude, dtype=np.float64),
+            )
+        return _fast_project(longitude, latitude)
     
     def unproject(self, x: float, y: float) -> Tuple[float, float]:
         """Unproject Web Mercator meters back to lon/lat.
         
         Args:
-            x: X coordinate in Web Mercator meters
-            y: Y coordinate in Web Mercator meters
+            x: X coordinate in Web Mercator meters, scalar or NumPy array
+            y: Y coordinate in Web Mercator meters, scalar or NumPy array
             
         Returns:
             Tuple of (longitude, latitude) in degrees
         """
-        lon, lat = self._from_mercator.transform(x, y)
+        lon, lat = _get_transformer(_WEB_MERCATOR, _WGS84).transform(x, y)
         return (lon, lat)
-
@@ -0,0 +1,165 @@
+"""Compiled braille rasterization and text encoding.
+
+Uses Numba when the optional ``numba`` dependency is installed and falls
+back to an equivalent NumPy implementation otherwise. The NumPy versions
+are always available under their ``*_numpy`` names.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+DOT_LUT = np.array([1, 2, 4, 64, 8, 16, 32, 128], dtype=np.uint8)
+"""Braille dot bit for subpixel (sx, sy), indexed by (sx << 2) | sy."""
+# Numba freezes global arrays into compiled code, so keep the table constant
+DOT_LUT.setflags(write=False)
+
+# Braille codepoints U+2800-U+28FF encode in UTF-8 as E2, A0 | (v >> 6), 80 | (v & 3F)
+_UTF8_LEAD = 0xE2
+_UTF8_MID = 0xA0
+_UTF8_LOW = 0x80
+
+
+def rasterize_segments_numpy(
+    grid: np.ndarray,
+    p0: np.ndarray,
+    p1: np.ndarray,
+    skip_start: np.ndarray,
+    width_px: int,
+    height_px: int
+) -> None:
+    """Draw line segments into a braille grid.
+    
+    Segments must already be clipped to the grid, since subpixels are
+    written without bounds checks.
+    
+    Args:
+        grid: Braille grid (uint8, shape (rows, cols))
+        p0: Segment start points, shape (N, 2), in integer subpixels (int32)
+        p1: Segment end points, shape (N, 2), in integer subpixels (int32)
+        skip_start: Per segment, whether its start subpixel is already drawn
+        width_px: Width in subpixels
+        height_px: Height in subpixels
+    """
+    if not len(p0):
+        return
+    
+    # Widen so the DDA products cannot overflow
+    x0 = p0[:, 0].astype(np.int64)
+    y0 = p0[:, 1].astype(np.int64)
+    dx = p1[:, 0].astype(np.int64) - x0
+    dy = p1[:, 1].astype(np.int64) - y0
+    
+    # A segment with `steps` steps covers steps + 1 subpixels,
+    # minus its start when that was already drawn
+    steps = np.maximum(np.abs(dx), np.abs(dy))
+    first = skip_start.astype(np.int64)
+    counts = steps + 1 - first
+    seg = np.repeat(np.arange(len(counts)), counts)
+    t = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - first, counts)
+    
+    # Integer DDA: x0 + round(dx * t / steps)
+    denom = 2 * np.maximum(steps, 1)[seg]
+    xs = x0[seg] + (2 * dx[seg] * t + denom // 2) // denom
+    ys = y0[seg] + (2 * dy[seg] * t + denom // 2) // denom
+    
+    bits = DOT_LUT[((xs & 1) << 2) | (ys & 3)]
+    np.bitwise_or.at(grid, (ys >> 2, xs >> 1), bits)
+
+
+def encode_grid_numpy(grid: np.ndarray) -> np.ndarray:
+    """Encode a braille grid as UTF-8 text, one line per row.
+    
+    Args:
+        grid: Braille grid (uint8, shape (rows, cols))
+        
+    Returns:
+        UTF-8 bytes (uint8 array); empty cells are spaces
+    """
+    rows, cols = grid.shape
+    # Three bytes per cell plus a newline per row; unused bytes are dropped
+    buf = np.empty((rows, cols * 3 + 1), dtype=np.uint8)
+    cells = buf[:, :-1].reshape(rows, cols, 3)
+    filled = grid != 0
+    cells[:, :, 0] = np.where(filled, _UTF8_LEAD, 0x20)
+    cells[:, :, 1] = _UTF8_MID | (grid >> 6)
+    cells[:, :, 2] = _UTF8_LOW | (grid & 0x3F)
+    buf[:, -1] = 0x0A
+    
+    keep = np.ones(buf.shape, dtype=bool)
+    keep[:, :-1].reshape(rows, cols, 3)[:, :, 1:] = filled[:, :, None]
+    return buf[keep][:-1]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def rasterize_segments(
+        grid: np.ndarray,
+        p0: np.ndarray,
+        p1: np.ndarray,
+        skip_start: np.ndarray,
+        width_px: int,
+        height_px: int
+    ) -> None:
+        """Draw line segments into a braille grid.
+        
+        Segments must already be clipped to the grid, since subpixels are
+        written without bounds checks.
+        
+        Args:
+            grid: Braille grid (uint8, shape (rows, cols))
+            p0: Segment start points, shape (N, 2), in integer subpixels (int32)
+            p1: Segment end points, shape (N, 2), in integer subpixels (int32)
+            skip_start: Per segment, whether its start subpixel is already drawn
+            width_px: Width in subpixels
+            height_px: Height in subpixels
+        """
+        for i in range(p0.shape[0]):
+            # Widen so the DDA products cannot overflow
+            x0 = np.int64(p0[i, 0])
+            y0 = np.int64(p0[i, 1])
+            dx = np.int64(p1[i, 0]) - x0
+            dy = np.int64(p1[i, 1]) - y0
+            steps = max(abs(dx), abs(dy))
+            denom = 2 * max(steps, 1)
+            for t in range(skip_start[i], steps + 1):
+                # Integer DDA: x0 + round(dx * t / steps)
+                x = x0 + (2 * dx * t + denom // 2) // denom
+                y = y0 + (2 * dy * t + denom // 2) // denom
+                grid[y >> 2, x >> 1] |= DOT_LUT[((x & 1) << 2) | (y & 3)]
+    
+    @njit(cache=True, boundscheck=False)
+    def encode_grid(grid: np.ndarray) -> np.ndarray:
+        """Encode a braille grid as UTF-8 text, one line per row.
+        
+        Args:
+            grid: Braille grid (uint8, shape (rows, cols))
+            
+        Returns:
+            UTF-8 bytes (uint8 array); empty cells are spaces
+        """
+        rows, cols = grid.shape
+        buf = np.empty(rows * (cols * 3 + 1), dtype=np.uint8)
+        n = 0
+        for r in range(rows):
+            if r:
+                buf[n] = 0x0A
+                n += 1
+            for c in range(cols):
+                v = grid[r, c]
+                if v:
+                    buf[n] = _UTF8_LEAD
+                    buf[n + 1] = _UTF8_MID | (v >> 6)
+                    buf[n + 2] = _UTF8_LOW | (v & 0x3F)
+                    n += 3
+                else:
+                    buf[n] = 0x20
+                    n += 1
+        return buf[:n]
+else:
+    rasterize_segments = rasterize_segments_numpy
+    encode_grid = encode_grid_numpy
@@ -1,6 +1,7 @@
 """Braille-based renderer for high-resolution text maps."""
 
-from typing import Any, List, Optional, Tuple
+import math
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import geopandas as gpd
@@ -8,117 +9,164 @@ try:
 except ImportError:
     GEOPANDAS_AVAILABLE = False
 
-from shapely.affinity import affine_transform
-from shapely.geometry import LineString, MultiLineString
+import numpy as np
+import shapely
 
 from geo_tui.domain.entities.map_data import MapPoint
 from geo_tui.domain.entities.viewport import Viewport
 from geo_tui.domain.interfaces.renderer import Renderer
+from geo_tui.infrastructure.rendering._braille_numba import encode_grid, rasterize_segments
 
-# Braille character mapping
-_BRAILLE_BASE = 0x2800
-_DOT_BIT = {
-    (0, 0): 1, (0, 1): 2, (0, 2): 4, (0, 3): 64,
-    (1, 0): 8, (1, 1): 16, (1, 2): 32, (1, 3): 128
-}
+# Number of zoom buckets kept in the simplification cache
+_SIMPLIFY_CACHE_SIZE = 16
 
 
-def _empty_braille_grid(cols: int, rows: int) -> List[List[int]]:
-    """Create an empty braille grid.
+def _braille_grid_to_str(grid: np.ndarray) -> str:
+    """Convert braille grid to string.
     
     Args:
-        cols: Number of columns (braille cells)
-        rows: Number of rows (braille cells)
+        grid: Braille grid
         
     Returns:
-        2D list of bitmasks
+        String representation
     """
-    return [[0 for _ in range(cols)] for __ in range(rows)]
+    return encode_grid(grid).tobytes().decode("utf-8")
 
 
-def _set_subpixel(grid: List[List[int]], col: int, row: int, sx: int, sy: int) -> None:
-    """Set a subpixel in the braille grid.
+def _explode_lines(geometries: np.ndarray) -> np.ndarray:
+    """Flatten geometries into their non-empty LineString parts.
     
     Args:
-        grid: Braille grid
-        col: Column (braille cell)
-        row: Row (braille cell)
-        sx: Subpixel x (0 or 1)
-        sy: Subpixel y (0-3)
+        geometries: Array of geometries; parts that are not lines are dropped
+        
+    Returns:
+        Array of LineStrings
     """
-    if 0 <= row < len(grid) and 0 <= col < len(grid[0]):
-        grid[row][col] |= _DOT_BIT[(sx, sy)]
+    parts = shapely.get_parts(geometries)
+    is_line = shapely.get_type_id(parts) == shapely.GeometryType.LINESTRING
+    parts = parts[is_line]
+    return parts[~shapely.is_empty(parts)]
 
 
-def _rasterize_line_to_braille(
-    grid: List[List[int]],
-    p0: Tuple[float, float],
-    p1: Tuple[float, float],
-    width_px: int,
-    height_px: int
-) -> None:
-    """Draw a line using Bresenham's algorithm.
+def _clip_segments(
+    p0: np.ndarray,
+    p1: np.ndarray,
+    xmax: float,
+    ymax: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Clip segments to the rectangle [0, xmax] x [0, ymax] (Liang-Barsky).
     
     Args:
-        grid: Braille grid
-        p0: Start point (x, y) in pixel coordinates
-        p1: End point (x, y) in pixel coordinates
-        width_px: Width in subpixels
-        height_px: Height in subpixels
+        p0: Segment start points, shape (N, 2)
+        p1: Segment end points, shape (N, 2)
+        xmax: Right edge of the rectangle
+        ymax: Bottom edge of the rectangle
+        
+    Returns:
+        Tuple of (p0, p1) for the segments that intersect the rectangle,
+        with both endpoints inside it
     """
-    x0, y0 = int(p0[0]), int(p0[1])
-    x1, y1 = int(p1[0]), int(p1[1])
+    lo = np.minimum(p0, p1)
+    hi = np.maximum(p0, p1)
     
-    dx = abs(x1 - x0)
-    dy = -abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx + dy
+    # Most segments are either entirely inside or entirely outside
+    # the rectangle; only the ones crossing an edge need clipping
+    inside = (lo[:, 0] >= 0) & (hi[:, 0] <= xmax) & (lo[:, 1] >= 0) & (hi[:, 1] <= ymax)
+    crossing = (
+        ~inside
+        & (hi[:, 0] >= 0) & (lo[:, 0] <= xmax) & (hi[:, 1] >= 0) & (lo[:, 1] <= ymax)
+    )
+    start = p0[crossing]
+    delta = p1[crossing] - start
     
-    while True:
-        if 0 <= x0 < width_px and 0 <= y0 < height_px:
-            col = x0 // 2
-            row = y0 // 4
-            sx_sub = x0 % 2
-            sy_sub = y0 % 4
-            _set_subpixel(grid, col, row, sx_sub, sy_sub)
-        
-        if x0 == x1 and y0 == y1:
-            break
-        
-        e2 = 2 * err
-        if e2 >= dy:
-            err += dy
-            x0 += sx
-        if e2 <= dx:
-            err += dx
-            y0 += sy
-
-
-def _braille_grid_to_str(grid: List[List[int]]) -> str:
-    """Convert braille grid to string.
+    # Boundary tests as (p, q) pairs: left, right, top, bottom
+    t0 = np.zeros(len(start))
+    t1 = np.ones(len(start))
+    keep = np.ones(len(start), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p, q in (
+            (-delta[:, 0], start[:, 0]),
+            (delta[:, 0], xmax - start[:, 0]),
+            (-delta[:, 1], start[:, 1]),
+            (delta[:, 1], ymax - start[:, 1]),
+        ):
+            r = q / p
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+            # Parallel to this edge and outside of it
+            keep &= (p != 0) | (q >= 0)
+    keep &= t0 <= t1
     
-    Args:
-        grid: Braille grid
-        
-    Returns:
-        String representation
-    """
-    rows = len(grid)
-    cols = len(grid[0]) if rows else 0
-    lines = []
-    for r in range(rows):
-        line = []
-        for c in range(cols):
-            code = _BRAILLE_BASE + grid[r][c]
-            line.append(chr(code) if grid[r][c] else " ")
-        lines.append("".join(line))
-    return "\n".join(lines)
+    start = start[keep]
+    delta = delta[keep]
+    clipped_p0 = start + t0[keep, None] * delta
+    clipped_p1 = start + t1[keep, None] * delta
+    # Guard against rounding just past the edges
+    np.clip(clipped_p0, 0.0, (xmax, ymax), out=clipped_p0)
+    np.clip(clipped_p1, 0.0, (xmax, ymax), out=clipped_p1)
+    return (
+        np.concatenate((p0[inside], clipped_p0)),
+        np.concatenate((p1[inside], clipped_p1)),
+    )
 
 
 class BrailleRenderer(Renderer):
     """Renderer using Unicode Braille characters for high resolution."""
     
+    def __init__(self):
+        """Initialize the renderer."""
+        self._source: Any = None
+        self._tree: Optional[shapely.STRtree] = None
+        self._lines: Optional[np.ndarray] = None
+        # Zoom bucket -> lines simplified for it so far, None where not yet needed
+        self._simplify_cache: Dict[float, np.ndarray] = {}
+        self._grid: Optional[np.ndarray] = None
+        self._xform_out = np.empty((0, 2), dtype=np.float64)
+    
+    def _use_source(self, geometries: Any) -> None:
+        """Reset per-dataset caches when a different GeoSeries is rendered.
+        
+        Args:
+            geometries: GeoSeries containing geometries
+        """
+        if geometries is self._source:
+            return
+        self._source = geometries
+        self._lines = _explode_lines(np.asarray(geometries.values))
+        self._tree = shapely.STRtree(self._lines)
+        self._simplify_cache.clear()
+    
+    def _get_simplified(self, meters_per_pixel: float, line_idx: np.ndarray) -> np.ndarray:
+        """Get lines simplified for a zoom level.
+        
+        Zoom levels are bucketed in tenths of a power of two so that panning
+        and small zoom steps reuse the same simplified geometries. Lines are
+        simplified on first use, so a new bucket only costs the visible lines.
+        
+        Args:
+            meters_per_pixel: Current zoom level
+            line_idx: Indices of the lines to get
+            
+        Returns:
+            Array of simplified LineStrings, parallel to line_idx
+        """
+        bucket = round(math.log2(meters_per_pixel), 1)
+        simplified = self._simplify_cache.get(bucket)
+        if simplified is None:
+            if len(self._simplify_cache) >= _SIMPLIFY_CACHE_SIZE:
+                del self._simplify_cache[next(iter(self._simplify_cache))]
+            simplified = self._simplify_cache[bucket] = np.full(len(self._lines), None)
+        
+        lines = simplified[line_idx]
+        missing = shapely.is_missing(lines)
+        if missing.any():
+            tol = max(2.0 ** bucket * 1.5, 500.0)
+            lines[missing] = shapely.simplify(
+                self._lines[line_idx[missing]], tol, preserve_topology=False
+            )
+            simplified[line_idx[missing]] = lines[missing]
+        return lines
+    
     def render(
         self,
         viewport: Viewport,
@@ -142,9 +190,13 @@ class BrailleRenderer(Renderer):
         if width <= 0 or height <= 0:
             return ""
         
-        # Build braille grid
+        # Build braille grid, reusing the previous frame's buffer
         cols, rows = width, height
-        grid = _empty_braille_grid(cols, rows)
+        grid = self._grid
+        if grid is None or grid.shape != (rows, cols):
+            grid = self._grid = np.zeros((rows, cols), dtype=np.uint8)
+        else:
+            grid.fill(0)
         
         # Subpixel resolution (2x4 per braille cell)
         px_w = cols * 2
@@ -153,40 +205,23 @@ class BrailleRenderer(Renderer):
         # Get viewport bounds
         minx, miny, maxx, maxy = viewport.get_bounds(px_w, px_h)
         
-        # Simplify tolerance based on zoom
-        tol = max(viewport.meters_per_pixel * 1.5, 500.0)
-        
         # Handle both GeoPandas GeoSeries and list of geometries
         if GEOPANDAS_AVAILABLE and isinstance(geometries, gpd.GeoSeries):
-            # Filter geometries by viewport using spatial index
-            if hasattr(geometries, 'sindex') and geometries.sindex is not None:
-                candidate_idx = list(geometries.sindex.intersection((minx, miny, maxx, maxy)))
-                if not candidate_idx:
-                    return ""
-                series = geometries.iloc[candidate_idx]
-            else:
-                series = geometries
-            
-            # Clip to viewport (optional optimization)
-            try:
-                viewport_poly = gpd.GeoSeries.from_bbox((minx, miny, maxx, maxy))
-                series = series.clip(viewport_poly.iloc[0])
-            except Exception:
-                pass
+            self._use_source(geometries)
             
-            # Simplify geometries
-            simplified = series.simplify(tol, preserve_topology=True)
-            geometries_to_draw = simplified
+            # Filter lines by viewport bounding box using the spatial index
+            candidate_idx = self._tree.query(shapely.box(minx, miny, maxx, maxy))
+            if not len(candidate_idx):
+                return ""
+            lines = self._get_simplified(viewport.meters_per_pixel, np.sort(candidate_idx))
+            coords, line_index = shapely.get_coordinates(lines, return_index=True)
         else:
             # Handle list of LineString geometries
-            from shapely.geometry import box
-            viewport_box = box(minx, miny, maxx, maxy)
-            geometries_to_draw = [
-                geom for geom in geometries
-                if isinstance(geom, LineString) and geom.intersects(viewport_box)
-            ]
-        
-        # Build affine transform from Mercator -> pixel space
+            lines = _explode_lines(np.asarray(geometries, dtype=object))
+            lines = lines[shapely.intersects(lines, shapely.box(minx, miny, maxx, maxy))]
+            coords, line_index = shapely.get_coordinates(lines, return_index=True)
+        
+        # Affine transform from Mercator -> pixel space
         # Pixel x = (X - minx) / meters_per_px
         # Pixel y = (maxy - Y) / meters_per_px (invert y)
         a = 1.0 / viewport.meters_per_pixel
@@ -194,30 +229,35 @@ class BrailleRenderer(Renderer):
         b = d = 0.0
         c = -minx * a
         f = maxy * (-e)  # because e is negative
-        xform = [a, b, d, e, c, f]
+        matrix = np.array([[a, b], [d, e]], dtype=np.float64)
+        offset = np.array([c, f], dtype=np.float64)
         
-        # Draw geometries
-        for geom in geometries_to_draw:
-            if geom.is_empty:
-                continue
-            
-            g = affine_transform(geom, xform)
-            
-            def draw_lines(lines):
-                for line in lines:
-                    coords = list(line.coords)
-                    for i in range(len(coords) - 1):
-                        x0, y0 = coords[i]
-                        x1, y1 = coords[i + 1]
-                        _rasterize_line_to_braille(
-                            grid, (x0, y0), (x1, y1),
-                            width_px=px_w, height_px=px_h
-                        )
-            
-            if isinstance(g, LineString):
-                draw_lines([g])
-            elif isinstance(g, MultiLineString):
-                draw_lines(g.geoms)
+        # Transform into a buffer kept across frames, grown as needed
+        n = len(coords)
+        if len(self._xform_out) < n:
+            self._xform_out = np.empty((max(n, 2 * len(self._xform_out)), 2))
+        pixels = self._xform_out[:n]
+        np.matmul(coords, matrix.T, out=pixels)
+        pixels += offset
+        
+        # Draw all segments of all lines in one batch; consecutive vertices
+        # form a segment only when they belong to the same line
+        same_line = line_index[1:] == line_index[:-1]
+        p0 = pixels[:-1][same_line]
+        p1 = pixels[1:][same_line]
+        
+        # Clip segments to the grid so the rasterizer needs no bounds checks
+        p0, p1 = _clip_segments(p0, p1, px_w - 1, px_h - 1)
+        
+        # Clipped endpoints are non-negative, so the cast truncates to the subpixel
+        p0 = p0.astype(np.int32)
+        p1 = p1.astype(np.int32)
+        
+        # Along a polyline each segment starts where the previous one ended;
+        # don't draw that shared subpixel twice
+        skip_start = np.zeros(len(p0), dtype=np.uint8)
+        skip_start[1:] = np.all(p0[1:] == p1[:-1], axis=1)
+        rasterize_segments(grid, p0, p1, skip_start, width_px=px_w, height_px=px_h)
         
         # Draw points if provided
         # Note: Points rendering requires projection, which should be passed to renderer
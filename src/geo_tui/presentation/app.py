@@ -181,9 +181,7 @@ class MapApp(App):
                     center_x = (minx + maxx) / 2
                     center_y = (miny + maxy) / 2
                     
-                    self.viewport.center_x = center_x
-                    self.viewport.center_y = center_y
-                    self.viewport.meters_per_pixel = meters_per_pixel
+                    self.viewport.reset(center_x, center_y, meters_per_pixel)
                     
                     # Refresh map widget and header after viewport adjustment
                     try:
@@ -198,7 +196,11 @@ class MapApp(App):
                     terminal_width_px = screen.size.width * 2
                     if terminal_width_px > 0:
                         meters_per_pixel = earth_circumference / terminal_width_px
-                        self.viewport.meters_per_pixel = meters_per_pixel
+                        self.viewport.reset(
+                            self.viewport.center_x,
+                            self.viewport.center_y,
+                            meters_per_pixel
+                        )
                         self.call_after_refresh(self._update_header)
         except Exception as e:
             # Silently fail - viewport will use default values
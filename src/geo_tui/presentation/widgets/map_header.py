@@ -1,10 +1,61 @@
 """Header widget for displaying map information."""
 
+import math
+from functools import lru_cache
+from typing import Tuple
+
 from textual.widgets import Static
 
 from geo_tui.domain.entities.viewport import Viewport
 from geo_tui.domain.interfaces.projection import Projection
 
+# log2 of the Web Mercator equator length (meters) over the 256 px tile size
+_LOG2_EC_OVER_256 = math.log2(40075017.0 / 256.0)
+
+
+@lru_cache(maxsize=64)
+def _compute_header_values(
+    center_x: float,
+    center_y: float,
+    meters_per_pixel: float,
+    px_w: int,
+    px_h: int,
+    projection: Projection
+) -> Tuple[float, Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
+    """Compute the zoom level and corner coordinates shown in the header.
+    
+    Takes the viewport as scalars, since Viewport is mutable and unhashable.
+    
+    Args:
+        center_x: Viewport center X in projected coordinates
+        center_y: Viewport center Y in projected coordinates
+        meters_per_pixel: Viewport zoom level
+        px_w: Width in subpixels
+        px_h: Height in subpixels
+        projection: Projection for coordinate conversion
+        
+    Returns:
+        Tuple of (zoom_level, center, top_left, bottom_right), where each
+        position is a (lon, lat) pair
+    """
+    # Get viewport bounds in projected coordinates
+    minx, miny, maxx, maxy = Viewport(
+        center_x, center_y, meters_per_pixel
+    ).get_bounds(px_w, px_h)
+    
+    # Convert to lat/lon
+    top_left = projection.unproject(minx, maxy)
+    bottom_right = projection.unproject(maxx, miny)
+    center = projection.unproject(center_x, center_y)
+    
+    # Calculate zoom level (approximate)
+    # Zoom level formula: zoom = log2(earth_circumference / (meters_per_pixel * tile_size))
+    zoom_level = (
+        _LOG2_EC_OVER_256 - math.log2(meters_per_pixel) if meters_per_pixel > 0 else 0.0
+    )
+    
+    return zoom_level, center, top_left, bottom_right
+
 
 class MapHeader(Static):
     """Header widget displaying map viewport information."""
@@ -20,6 +71,7 @@ class MapHeader(Static):
         super().__init__("Loading map...", **kwargs)
         self._viewport = viewport
         self._projection = projection
+        self._last_key = None
     
     @property
     def viewport(self) -> Viewport:
@@ -28,8 +80,20 @@ class MapHeader(Static):
     
     @viewport.setter
     def viewport(self, value: Viewport) -> None:
-        """Set the viewport and trigger refresh."""
-        # Always update, even if same object (viewport properties may have changed)
+        """Set the viewport and trigger refresh if the view changed."""
+        # Compare by value, the same viewport object may have been mutated.
+        # The screen size determines the map size the header describes.
+        try:
+            size = self.app.screen.size
+        except Exception:
+            size = self.size
+        key = (
+            value.center_x, value.center_y, value.meters_per_pixel,
+            size.width, size.height
+        )
+        if key == self._last_key:
+            return
+        self._last_key = key
         self._viewport = value
         # Use call_after_refresh to ensure app/widget is ready
         if hasattr(self, 'app') and self.app is not None:
@@ -76,25 +140,15 @@ class MapHeader(Static):
         px_w = map_width * 2
         px_h = map_height * 4
         
-        # Get viewport bounds in projected coordinates
-        minx, miny, maxx, maxy = self._viewport.get_bounds(px_w, px_h)
-        
-        # Convert to lat/lon
-        top_left_lon, top_left_lat = self._projection.unproject(minx, maxy)
-        bottom_right_lon, bottom_right_lat = self._projection.unproject(maxx, miny)
-        center_lon, center_lat = self._projection.unproject(
-            self._viewport.center_x, self._viewport.center_y
+        zoom_level, center, top_left, bottom_right = _compute_header_values(
+            self._viewport.center_x,
+            self._viewport.center_y,
+            self._viewport.meters_per_pixel,
+            px_w,
+            px_h,
+            self._projection,
         )
         
-        # Calculate zoom level (approximate)
-        # Web Mercator: meters_per_pixel at equator
-        # Zoom level formula: zoom = log2(earth_circumference / (meters_per_pixel * tile_size))
-        earth_circumference = 40075017.0  # meters at equator
-        zoom_level = 0.0
-        if self._viewport.meters_per_pixel > 0:
-            import math
-            zoom_level = math.log2(earth_circumference / (self._viewport.meters_per_pixel * 256))
-        
         # Format coordinates
         def format_coord(lon: float, lat: float) -> str:
             """Format coordinates nicely."""
@@ -105,9 +159,9 @@ class MapHeader(Static):
         # Build header string
         header_parts = [
             f"Zoom: {zoom_level:.2f}",
-            f"Center: {format_coord(center_lon, center_lat)}",
-            f"Top-Left: {format_coord(top_left_lon, top_left_lat)}",
-            f"Bottom-Right: {format_coord(bottom_right_lon, bottom_right_lat)}",
+            f"Center: {format_coord(*center)}",
+            f"Top-Left: {format_coord(*top_left)}",
+            f"Bottom-Right: {format_coord(*bottom_right)}",
         ]
         
         header = " | ".join(header_parts)
@@ -1,5 +1,9 @@
 """Map widget for displaying the map."""
 
+import threading
+from functools import partial
+from typing import Optional, Tuple
+
 from textual.binding import Binding
 from textual.widget import Widget
 from textual import events
@@ -8,6 +12,9 @@ from geo_tui.application.services.map_service import MapService
 from geo_tui.application.services.navigation_service import NavigationService
 from geo_tui.domain.entities.viewport import Viewport
 
+# Delay in seconds used to coalesce bursts of navigation input into one frame
+_REFRESH_DELAY = 0.016
+
 
 class MapWidget(Widget):
     """Widget for displaying the interactive map."""
@@ -42,6 +49,10 @@ class MapWidget(Widget):
         self.map_service = map_service
         self.navigation_service = navigation_service
         self.viewport = viewport
+        self._render_pending = False
+        self._render_key: Optional[Tuple[float, float, float, int, int]] = None
+        self._cached_render = ""
+        self._render_lock = threading.Lock()
     
     def on_mount(self) -> None:
         """Called when widget is mounted."""
@@ -51,45 +62,37 @@ class MapWidget(Widget):
         # Just update the header
         self.call_after_refresh(self._update_header)
     
+    def on_resize(self, event: events.Resize) -> None:
+        """Called when widget is resized.
+        
+        Args:
+            event: Resize event
+        """
+        self.navigation_service.set_viewport_size(event.size.width, event.size.height)
+    
     def action_pan_left(self) -> None:
         """Pan the map left."""
-        step = 0.2
-        width = self.size.width
-        px_w = width * 2
-        span_x = px_w * self.viewport.meters_per_pixel
-        self.viewport.pan(-step * span_x, 0)
-        self.refresh()
-        self._update_header()
+        before = self._view_key()
+        self.navigation_service.pan_left()
+        self._refresh_if_changed(before)
     
     def action_pan_right(self) -> None:
         """Pan the map right."""
-        step = 0.2
-        width = self.size.width
-        px_w = width * 2
-        span_x = px_w * self.viewport.meters_per_pixel
-        self.viewport.pan(step * span_x, 0)
-        self.refresh()
-        self._update_header()
+        before = self._view_key()
+        self.navigation_service.pan_right()
+        self._refresh_if_changed(before)
     
     def action_pan_up(self) -> None:
         """Pan the map up."""
-        step = 0.2
-        height = self.size.height
-        px_h = height * 4
-        span_y = px_h * self.viewport.meters_per_pixel
-        self.viewport.pan(0, step * span_y)
-        self.refresh()
-        self._update_header()
+        before = self._view_key()
+        self.navigation_service.pan_up()
+        self._refresh_if_changed(before)
     
     def action_pan_down(self) -> None:
         """Pan the map down."""
-        step = 0.2
-        height = self.size.height
-        px_h = height * 4
-        span_y = px_h * self.viewport.meters_per_pixel
-        self.viewport.pan(0, -step * span_y)
-        self.refresh()
-        self._update_header()
+        before = self._view_key()
+        self.navigation_service.pan_down()
+        self._refresh_if_changed(before)
     
     def action_quit(self) -> None:
         """Quit the application."""
@@ -98,22 +101,22 @@ class MapWidget(Widget):
     def action_zoom_in(self) -> None:
         """Zoom in."""
         zoom_factor = 0.8
+        before = self._view_key()
         self.viewport.zoom(zoom_factor)
-        self.refresh()
-        self._update_header()
+        self._refresh_if_changed(before)
     
     def action_zoom_out(self) -> None:
         """Zoom out."""
         zoom_factor = 0.8
+        before = self._view_key()
         self.viewport.zoom(1.0 / zoom_factor)
-        self.refresh()
-        self._update_header()
+        self._refresh_if_changed(before)
     
     def action_reset(self) -> None:
         """Reset the viewport."""
+        before = self._view_key()
         self.viewport.reset()
-        self.refresh()
-        self._update_header()
+        self._refresh_if_changed(before)
     
     def on_key(self, event: events.Key) -> None:
         """Handle key events.
@@ -123,11 +126,43 @@ class MapWidget(Widget):
         """
         # Handle r for reset
         if event.key == "r":
+            before = self._view_key()
             self.viewport.reset()
-            self.refresh()
-            self._update_header()
+            self._refresh_if_changed(before)
             event.stop()
     
+    def _view_key(self) -> Tuple[float, float, float]:
+        """Get the values that determine what the map shows.
+        
+        Returns:
+            Tuple of (center_x, center_y, meters_per_pixel)
+        """
+        return (
+            self.viewport.center_x, self.viewport.center_y, self.viewport.meters_per_pixel
+        )
+    
+    def _refresh_if_changed(self, before: Tuple[float, float, float]) -> None:
+        """Schedule a refresh unless a navigation action left the view unchanged.
+        
+        Args:
+            before: View key captured before the action
+        """
+        if self._view_key() != before:
+            self._schedule_refresh()
+    
+    def _schedule_refresh(self) -> None:
+        """Schedule a map and header refresh, coalescing repeated requests."""
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.set_timer(_REFRESH_DELAY, self._flush_refresh)
+    
+    def _flush_refresh(self) -> None:
+        """Refresh the map and header after a scheduled delay."""
+        self._render_pending = False
+        self.refresh()
+        self._update_header()
+    
     def _update_header(self) -> None:
         """Update the header widget if it exists."""
         # Find the header widget in the app
@@ -142,6 +177,9 @@ class MapWidget(Widget):
     def render(self) -> str:
         """Render the map.
         
+        Returns the last completed frame and starts a background render when
+        the view or size has changed since, so slow renders never block input.
+        
         Returns:
             Rendered map as string
         """
@@ -156,22 +194,50 @@ class MapWidget(Widget):
         width = min(width, 1000)
         height = min(height, 1000)
         
-        # Render the map with constrained dimensions
-        rendered = self.map_service.render(self.viewport, width, height)
+        key = (*self._view_key(), width, height)
+        if key != self._render_key:
+            self._render_key = key
+            # Render a snapshot, the viewport may change while the worker runs
+            viewport = Viewport(*key[:3])
+            self.run_worker(
+                partial(self._render_in_thread, key, viewport, width, height),
+                group="map-render",
+                exclusive=True,
+                thread=True,
+            )
         
-        # Ensure the output doesn't exceed the expected size
-        # Split into lines and truncate if necessary
-        lines = rendered.split('\n')
-        if len(lines) > height:
-            lines = lines[:height]
-        rendered = '\n'.join(lines)
+        return self._cached_render
+    
+    def _render_in_thread(
+        self,
+        key: Tuple[float, float, float, int, int],
+        viewport: Viewport,
+        width: int,
+        height: int
+    ) -> None:
+        """Render a frame in a worker thread and hand it to the UI thread.
         
-        # Ensure each line doesn't exceed width
-        final_lines = []
-        for line in lines:
-            if len(line) > width:
-                line = line[:width]
-            final_lines.append(line)
+        Args:
+            key: View key and size the frame is rendered for
+            viewport: Snapshot of the viewport to render
+            width: Width in characters
+            height: Height in characters
+        """
+        # Superseded workers may still be running; render one frame at a time
+        with self._render_lock:
+            rendered = self.map_service.render(viewport, width, height)
         
-        return '\n'.join(final_lines)
-
+        # The renderer draws exactly width x height cells, so no truncation is needed
+        self.app.call_from_thread(self._apply_render, key, rendered)
+    
+    def _apply_render(self, key: Tuple[float, float, float, int, int], rendered: str) -> None:
+        """Show a frame rendered in the background, unless it is outdated.
+        
+        Args:
+            key: View key and size the frame was rendered for
+            rendered: Rendered map
+        """
+        if key != self._render_key:
+            return
+        self._cached_render = rendered
+        self.refresh()
@@ -1,17 +1,23 @@
 """Tests for map service."""
 
 import pytest
+from unittest.mock import Mock
+from shapely.geometry import LineString
 
 from geo_tui.application.services.map_service import MapService
 from geo_tui.domain.entities.map_data import MapPoint, MapDataUpdate
 from geo_tui.domain.entities.viewport import Viewport
 
+pytestmark = pytest.mark.usefixtures("memoize_projection", "reset_map_service")
+
 
 class TestMapService:
     """Test suite for MapService."""
     
-    def test_map_service_initialization(self, map_service):
+    def test_map_service_initialization(self, cached_geometry_loader, projection, renderer):
         """Test map service initialization."""
+        # The shared map_service may already hold geometries loaded by other tests
+        map_service = MapService(cached_geometry_loader, projection, renderer)
         assert map_service is not None
         assert map_service.get_geometries() is None
     
@@ -23,6 +29,33 @@ class TestMapService:
         assert geometries is not None
         assert len(geometries) > 0
     
+    def test_geometries_as_arrays(self, projection, renderer):
+        """Test projected lines are exposed as flat coordinate arrays."""
+        lines = [
+            LineString([(0.0, 0.0), (10.0, 10.0)]),
+            LineString([(10.0, 10.0), (20.0, 0.0), (30.0, -10.0)]),
+        ]
+        map_service = MapService(Mock(load=Mock(return_value=lines)), projection, renderer)
+        map_service.load_geometries()
+        
+        coords, offsets = map_service.geometries_as_arrays()
+        assert coords.shape == (5, 2)
+        assert list(offsets) == [0, 2, 5]
+        assert tuple(coords[2]) == pytest.approx(projection.project(10.0, 10.0))
+        
+        minx, miny, maxx, maxy = map_service.get_geometry_bounds()
+        assert (minx, maxy) == pytest.approx(projection.project(0.0, 10.0))
+        assert (maxx, miny) == pytest.approx(projection.project(30.0, -10.0))
+    
+    def test_visible_lines(self, projection, renderer):
+        """Test that lines outside the viewport are culled."""
+        lines = [LineString([(lon, 0.0), (lon + 0.1, 0.1)]) for lon in range(-150, 150)]
+        map_service = MapService(Mock(load=Mock(return_value=lines)), projection, renderer)
+        map_service.load_geometries()
+        
+        viewport = Viewport(0.0, 0.0, 1000.0)
+        assert list(map_service._get_visible_lines(viewport, 80, 24)) == [150]
+    
     def test_add_point(self, map_service):
         """Test adding a point."""
         point = MapPoint(45.0, -30.0, {"test": "data"})
@@ -32,6 +65,16 @@ class TestMapService:
         assert len(points) == 1
         assert points[0] == point
     
+    def test_bulk_add_points(self, map_service, projection):
+        """Test adding many points at once."""
+        points = [MapPoint(i * 0.1, (i % 80) - 40.0) for i in range(1000)]
+        map_service.bulk_add_points(points)
+        
+        assert map_service.get_points() == points
+        assert tuple(map_service._points_xy[999]) == pytest.approx(
+            projection.project(99.9, -1.0)
+        )
+    
     def test_update_map_data(self, map_service):
         """Test updating map data."""
         update = MapDataUpdate(45.0, -30.0, {"temperature": 25.0})
@@ -55,6 +98,37 @@ class TestMapService:
         assert len(points) == 1
         assert points[0].data == {"value": 2}
     
+    def test_update_point_added_directly(self, map_service):
+        """Test updating a point that was added with add_point."""
+        map_service.add_point(MapPoint(45.0, -30.0, {"value": 1}))
+        map_service.update_map_data(MapDataUpdate(45.00001, -30.00001, {"value": 2}))
+        
+        points = map_service.get_points()
+        assert len(points) == 1
+        assert points[0].data == {"value": 2}
+    
+    @pytest.mark.parametrize("first_lon, second_lon", [
+        (0.00004, 0.00006),
+        (-0.00004, 0.00004),
+        (0.00014, 0.00006),
+    ])
+    def test_update_point_across_cell_boundary(self, map_service, first_lon, second_lon):
+        """Test updates within the tolerance merge even in neighbouring index cells."""
+        map_service.update_map_data(MapDataUpdate(first_lon, 10.0, {"value": 1}))
+        map_service.update_map_data(MapDataUpdate(second_lon, 10.00005, {"value": 2}))
+        
+        points = map_service.get_points()
+        assert len(points) == 1
+        assert points[0].longitude == second_lon
+        assert points[0].data == {"value": 2}
+    
+    def test_update_point_outside_tolerance(self, map_service):
+        """Test updates just beyond the tolerance add a new point."""
+        map_service.update_map_data(MapDataUpdate(0.00004, 10.0, {"value": 1}))
+        map_service.update_map_data(MapDataUpdate(0.00015, 10.0, {"value": 2}))
+        
+        assert len(map_service.get_points()) == 2
+    
     def test_clear_points(self, map_service):
         """Test clearing points."""
         map_service.add_point(MapPoint(45.0, -30.0))
@@ -65,8 +139,25 @@ class TestMapService:
         map_service.clear_points()
         assert len(map_service.get_points()) == 0
     
-    def test_render_without_geometries(self, map_service):
+    def test_visible_points(self, map_service):
+        """Test that only points inside the viewport are visible."""
+        inside = MapPoint(0.3, 0.3)
+        outside = MapPoint(45.0, -30.0)
+        map_service.add_point(outside)
+        map_service.add_point(inside)
+        
+        # 160 x 96 subpixels at 1000 m/px spans roughly +/-0.7 x +/-0.4 degrees
+        viewport = Viewport(0.0, 0.0, 1000.0)
+        assert map_service._get_visible_points(viewport, 80, 24) == [inside]
+        
+        map_service.update_map_data(MapDataUpdate(45.0, -30.0, {"value": 1}))
+        viewport.pan(*map_service.projection.project(45.0, -30.0))
+        visible = map_service._get_visible_points(viewport, 80, 24)
+        assert [p.data for p in visible] == [{"value": 1}]
+    
+    def test_render_without_geometries(self, projection, renderer):
         """Test rendering without loaded geometries."""
+        map_service = MapService(Mock(), projection, renderer)
         viewport = Viewport(0.0, 0.0, 1_000_000.0)
         result = map_service.render(viewport, 80, 24)
         
@@ -80,4 +171,22 @@ class TestMapService:
         
         assert isinstance(result, str)
         assert len(result) > 0
-
+    
+    def test_render_reuses_unchanged_frame(self, projection):
+        """Test rendering is skipped when nothing changed since the last frame."""
+        lines = [LineString([(0.0, 0.0), (10.0, 10.0)])]
+        renderer = Mock(render=Mock(return_value="map"))
+        map_service = MapService(Mock(load=Mock(return_value=lines)), projection, renderer)
+        map_service.load_geometries()
+        viewport = Viewport(0.0, 0.0, 1_000_000.0)
+        
+        assert map_service.render(viewport, 80, 24) == "map"
+        assert map_service.render(viewport, 80, 24) == "map"
+        assert renderer.render.call_count == 1
+        
+        map_service.add_point(MapPoint(1.0, 1.0))
+        map_service.render(viewport, 80, 24)
+        viewport.pan(1000.0, 0.0)
+        map_service.render(viewport, 80, 24)
+        map_service.render(viewport, 40, 24)
+        assert renderer.render.call_count == 4
@@ -1,9 +1,8 @@
 """Tests for navigation service."""
 
-import pytest
+import operator
 
-from geo_tui.application.services.navigation_service import NavigationService
-from geo_tui.domain.entities.viewport import Viewport
+import pytest
 
 
 class TestNavigationService:
@@ -14,33 +13,30 @@ class TestNavigationService:
         assert navigation_service is not None
         assert navigation_service.viewport is not None
     
-    def test_pan_left(self, navigation_service):
-        """Test panning left."""
-        initial_x = navigation_service.viewport.center_x
-        navigation_service.pan_left()
+    @pytest.mark.parametrize("method,axis,sign", [
+        ("pan_left", "center_x", -1),
+        ("pan_right", "center_x", 1),
+        ("pan_up", "center_y", 1),
+        ("pan_down", "center_y", -1),
+    ])
+    def test_pan_direction(self, navigation_service, method, axis, sign):
+        """Test each pan action moves the center in its direction."""
+        before = getattr(navigation_service.viewport, axis)
+        getattr(navigation_service, method)()
+        after = getattr(navigation_service.viewport, axis)
         
-        assert navigation_service.viewport.center_x < initial_x
+        assert (after - before) * sign > 0
     
-    def test_pan_right(self, navigation_service):
-        """Test panning right."""
-        initial_x = navigation_service.viewport.center_x
-        navigation_service.pan_right()
+    def test_pan_uses_viewport_size(self, navigation_service):
+        """Test that pan steps scale with the display size and zoom."""
+        navigation_service.set_viewport_size(50, 20)
         
-        assert navigation_service.viewport.center_x > initial_x
-    
-    def test_pan_up(self, navigation_service):
-        """Test panning up."""
-        initial_y = navigation_service.viewport.center_y
-        navigation_service.pan_up()
+        navigation_service.pan_right()
+        assert navigation_service.viewport.center_x == pytest.approx(0.2 * 50 * 2 * 1_000_000.0)
         
-        assert navigation_service.viewport.center_y > initial_y
-    
-    def test_pan_down(self, navigation_service):
-        """Test panning down."""
-        initial_y = navigation_service.viewport.center_y
+        navigation_service.zoom_in(0.5)
         navigation_service.pan_down()
-        
-        assert navigation_service.viewport.center_y < initial_y
+        assert navigation_service.viewport.center_y == pytest.approx(-0.2 * 20 * 4 * 500_000.0)
     
     def test_pan(self, navigation_service):
         """Test panning with deltas."""
@@ -52,19 +48,24 @@ class TestNavigationService:
         assert navigation_service.viewport.center_x == initial_x + 100.0
         assert navigation_service.viewport.center_y == initial_y + 200.0
     
-    def test_zoom_in(self, navigation_service):
-        """Test zooming in."""
+    @pytest.mark.parametrize("method,compare", [
+        ("zoom_in", operator.lt),
+        ("zoom_out", operator.gt),
+    ])
+    def test_zoom(self, navigation_service, method, compare):
+        """Test zooming in decreases and zooming out increases the scale."""
         initial_scale = navigation_service.viewport.meters_per_pixel
-        navigation_service.zoom_in()
+        getattr(navigation_service, method)()
         
-        assert navigation_service.viewport.meters_per_pixel < initial_scale
+        assert compare(navigation_service.viewport.meters_per_pixel, initial_scale)
     
-    def test_zoom_out(self, navigation_service):
-        """Test zooming out."""
+    @pytest.mark.parametrize("factor", [0.5, 0.8, 1.0, 1.25, 2.0, 10.0])
+    def test_zoom_factor(self, navigation_service, factor):
+        """Test zoom factors scale meters per pixel proportionally."""
         initial_scale = navigation_service.viewport.meters_per_pixel
-        navigation_service.zoom_out()
+        navigation_service.viewport.zoom(factor)
         
-        assert navigation_service.viewport.meters_per_pixel > initial_scale
+        assert navigation_service.viewport.meters_per_pixel == pytest.approx(initial_scale * factor)
     
     def test_reset(self, navigation_service):
         """Test resetting viewport."""
@@ -1,7 +1,13 @@
 """Pytest configuration and fixtures."""
 
+import functools
+
 import pytest
 from pathlib import Path
+from unittest.mock import Mock
+
+import geopandas as gpd
+from shapely.geometry import LineString
 
 from geo_tui.domain.entities.viewport import Viewport
 from geo_tui.infrastructure.projection.mercator_projection import MercatorProjection
@@ -10,6 +16,42 @@ from geo_tui.infrastructure.rendering.braille_renderer import BrailleRenderer
 from geo_tui.application.services.map_service import MapService
 from geo_tui.application.services.navigation_service import NavigationService
 
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Parsed once; GeoSeries built from its immutable CRS skip EPSG code lookups
+EMPTY_GEOSERIES = gpd.GeoSeries([], crs="EPSG:3857")
+
+
+def _memoize_scalar_calls(method):
+    """Cache a projection method's results for scalar coordinate arguments.
+    
+    Array arguments are unhashable and always go to the original method.
+    """
+    cached = functools.lru_cache(maxsize=4096)(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, x, y):
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            return cached(self, x, y)
+        return method(self, x, y)
+    return wrapper
+
+
+@pytest.fixture(scope="module")
+def memoize_projection():
+    """Memoize MercatorProjection for the repeated fixed coordinates used in a module.
+    
+    Opt-in for modules that only consume projected values; never use it where
+    the projection itself is under test.
+    """
+    original_project = MercatorProjection.project
+    original_unproject = MercatorProjection.unproject
+    MercatorProjection.project = _memoize_scalar_calls(original_project)
+    MercatorProjection.unproject = _memoize_scalar_calls(original_unproject)
+    yield
+    MercatorProjection.project = original_project
+    MercatorProjection.unproject = original_unproject
+
 
 @pytest.fixture
 def viewport():
@@ -18,27 +60,70 @@ def viewport():
 
 
 @pytest.fixture
+def make_viewport():
+    """Create a factory for test viewports with custom center and scale."""
+    def make(center_x=0.0, center_y=0.0, meters_per_pixel=1000.0):
+        return Viewport(center_x, center_y, meters_per_pixel)
+    return make
+
+
+@pytest.fixture(scope="session")
 def projection():
     """Create a projection instance."""
     return MercatorProjection()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def geometry_loader():
-    """Create a geometry loader."""
-    return GeoPandasLoader()
+    """Create a geometry loader for the bundled globe data."""
+    return GeoPandasLoader(DATA_DIR / "globe.geo.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def loaded_geometries(geometry_loader):
+    """Load the test geometries once per session."""
+    return geometry_loader.load()
+
+
+@pytest.fixture(scope="session")
+def empty_geoseries():
+    """Create an empty GeoSeries in Web Mercator."""
+    return EMPTY_GEOSERIES
+
+
+@pytest.fixture(scope="session")
+def diag_line_geoseries():
+    """Create a GeoSeries with one diagonal line through the origin in Web Mercator."""
+    line = LineString([(-1000000, -1000000), (1000000, 1000000)])
+    return gpd.GeoSeries([line], crs=EMPTY_GEOSERIES.crs)
+
+
+@pytest.fixture(scope="session")
 def renderer():
     """Create a renderer instance."""
     return BrailleRenderer()
 
 
+@pytest.fixture(scope="session")
+def cached_geometry_loader(loaded_geometries):
+    """Create a loader that returns the session's loaded geometries."""
+    return Mock(load=Mock(return_value=loaded_geometries))
+
+
+@pytest.fixture(scope="session")
+def map_service(cached_geometry_loader, projection, renderer):
+    """Create a map service instance that loads the cached geometries.
+    
+    Shared by the whole session, so loaded geometries are reused; modules
+    that add points use reset_map_service to start each test without any.
+    """
+    return MapService(cached_geometry_loader, projection, renderer)
+
+
 @pytest.fixture
-def map_service(geometry_loader, projection, renderer):
-    """Create a map service instance."""
-    return MapService(geometry_loader, projection, renderer)
+def reset_map_service(map_service):
+    """Clear points left on the shared map service by earlier tests."""
+    map_service.clear_points()
 
 
 @pytest.fixture
@@ -21,21 +21,16 @@ class TestMapPoint:
         point = MapPoint(45.0, -30.0, data=data)
         assert point.data == data
     
-    def test_map_point_validation_longitude(self):
-        """Test longitude validation."""
-        with pytest.raises(ValueError, match="Longitude must be between"):
-            MapPoint(200.0, 0.0)
-        
-        with pytest.raises(ValueError, match="Longitude must be between"):
-            MapPoint(-200.0, 0.0)
-    
-    def test_map_point_validation_latitude(self):
-        """Test latitude validation."""
-        with pytest.raises(ValueError, match="Latitude must be between"):
-            MapPoint(0.0, 100.0)
-        
-        with pytest.raises(ValueError, match="Latitude must be between"):
-            MapPoint(0.0, -100.0)
+    @pytest.mark.parametrize("lon,lat,message", [
+        (200.0, 0.0, "Longitude must be between"),
+        (-200.0, 0.0, "Longitude must be between"),
+        (0.0, 100.0, "Latitude must be between"),
+        (0.0, -100.0, "Latitude must be between"),
+    ])
+    def test_map_point_validation(self, lon, lat, message):
+        """Test out-of-range coordinates are rejected."""
+        with pytest.raises(ValueError, match=message):
+            MapPoint(lon, lat)
     
     def test_map_point_boundary_values(self):
         """Test boundary values are accepted."""
@@ -60,6 +55,14 @@ class TestMapDataUpdate:
         assert update.latitude == -30.0
         assert update.data == data
     
+    def test_map_data_update_validation(self):
+        """Test coordinates are validated when the update is created."""
+        with pytest.raises(ValueError, match="Longitude must be between"):
+            MapDataUpdate(200.0, 0.0, {})
+        
+        with pytest.raises(ValueError, match="Latitude must be between"):
+            MapDataUpdate(0.0, -100.0, {})
+    
     def test_to_point(self):
         """Test conversion to MapPoint."""
         data = {"value": 42}
@@ -70,4 +73,4 @@ class TestMapDataUpdate:
         assert point.longitude == 45.0
         assert point.latitude == -30.0
         assert point.data == data
-
+        assert point == MapPoint(45.0, -30.0, data)
@@ -15,29 +15,44 @@ class TestViewport:
         assert viewport.center_y == 200.0
         assert viewport.meters_per_pixel == 1000.0
     
-    def test_get_bounds(self):
-        """Test getting viewport bounds."""
-        viewport = Viewport(0.0, 0.0, 1000.0)
-        minx, miny, maxx, maxy = viewport.get_bounds(100, 50)
-        
+    @pytest.mark.parametrize("width,height,meters_per_pixel,expected", [
         # Width: 100 pixels * 1000 m/px = 100000 m, half = 50000
         # Height: 50 pixels * 1000 m/px = 50000 m, half = 25000
-        assert minx == -50000.0
-        assert maxx == 50000.0
-        assert miny == -25000.0
-        assert maxy == 25000.0
+        (100, 50, 1000.0, (-50000.0, -25000.0, 50000.0, 25000.0)),
+        (80, 24, 1_000_000.0, (-40_000_000.0, -12_000_000.0, 40_000_000.0, 12_000_000.0)),
+        (1, 1, 2.0, (-1.0, -1.0, 1.0, 1.0)),
+    ])
+    def test_get_bounds(self, make_viewport, width, height, meters_per_pixel, expected):
+        """Test getting viewport bounds."""
+        viewport = make_viewport(meters_per_pixel=meters_per_pixel)
+        assert viewport.get_bounds(width, height) == expected
+    
+    def test_get_bounds_after_pan_and_zoom(self, make_viewport):
+        """Test bounds are recomputed after the viewport changes."""
+        viewport = make_viewport()
+        assert viewport.get_bounds(100, 50) == (-50000.0, -25000.0, 50000.0, 25000.0)
+        
+        viewport.pan(1000.0, 0.0)
+        assert viewport.get_bounds(100, 50) == (-49000.0, -25000.0, 51000.0, 25000.0)
+        
+        viewport.zoom(2.0)
+        assert viewport.get_bounds(100, 50) == (-99000.0, -50000.0, 101000.0, 50000.0)
+        assert viewport.get_bounds(10, 10) == (-9000.0, -10000.0, 11000.0, 10000.0)
+        
+        viewport.center_x = 0.0
+        assert viewport.get_bounds(10, 10) == (-10000.0, -10000.0, 10000.0, 10000.0)
     
-    def test_pan(self):
+    def test_pan(self, make_viewport):
         """Test panning the viewport."""
-        viewport = Viewport(0.0, 0.0, 1000.0)
+        viewport = make_viewport()
         viewport.pan(100.0, 200.0)
         
         assert viewport.center_x == 100.0
         assert viewport.center_y == 200.0
     
-    def test_zoom(self):
+    def test_zoom(self, make_viewport):
         """Test zooming the viewport."""
-        viewport = Viewport(0.0, 0.0, 1000.0)
+        viewport = make_viewport()
         viewport.zoom(0.5)  # Zoom in
         
         assert viewport.meters_per_pixel == 500.0
@@ -45,18 +60,18 @@ class TestViewport:
         viewport.zoom(2.0)  # Zoom out
         assert viewport.meters_per_pixel == 1000.0
     
-    def test_reset(self):
+    def test_reset(self, make_viewport):
         """Test resetting the viewport."""
-        viewport = Viewport(100.0, 200.0, 500.0)
+        viewport = make_viewport(100.0, 200.0, 500.0)
         viewport.reset()
         
         assert viewport.center_x == 0.0
         assert viewport.center_y == 0.0
         assert viewport.meters_per_pixel == 1_000_000.0
     
-    def test_reset_with_custom_values(self):
+    def test_reset_with_custom_values(self, make_viewport):
         """Test resetting with custom values."""
-        viewport = Viewport(0.0, 0.0, 1000.0)
+        viewport = make_viewport()
         viewport.reset(50.0, 75.0, 2000.0)
         
         assert viewport.center_x == 50.0
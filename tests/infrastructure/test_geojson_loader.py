@@ -0,0 +1,72 @@
+"""Tests for the GeoJSON geometry loader."""
+
+import json
+import os
+
+import pytest
+
+from geo_tui.infrastructure.geometry.geojson_loader import GeoJSONLoader
+
+
+def _write_square(path, size):
+    """Write a FeatureCollection with a single square polygon."""
+    ring = [[0.0, 0.0], [size, 0.0], [size, size], [0.0, size], [0.0, 0.0]]
+    path.write_text(json.dumps({
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [ring]}},
+        ],
+    }))
+
+
+class TestGeoJSONLoader:
+    """Test suite for GeoJSONLoader."""
+    
+    def test_load_requires_data_source(self):
+        """Test that a data source is required."""
+        with pytest.raises(ValueError):
+            GeoJSONLoader().load()
+    
+    def test_load_polygon_as_line(self, tmp_path):
+        """Test polygons are loaded as their exterior lines."""
+        path = tmp_path / "square.geo.json"
+        _write_square(path, 1.0)
+        
+        lines = GeoJSONLoader(path).load()
+        
+        assert len(lines) == 1
+        assert list(lines[0].coords) == [(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]
+    
+    def test_load_multi_geometries(self, tmp_path):
+        """Test multi-part geometries are split into one line per part."""
+        path = tmp_path / "multi.geo.json"
+        path.write_text(json.dumps({
+            "type": "MultiPolygon",
+            "coordinates": [
+                [[[0, 0], [1, 0], [1, 1], [0, 0]], [[0.2, 0.2], [0.5, 0.2], [0.2, 0.5], [0.2, 0.2]]],
+                [[[5, 5], [6, 5], [6, 6], [5, 5]]],
+            ],
+        }))
+        
+        lines = GeoJSONLoader(path).load()
+        
+        # Only exterior rings become lines
+        assert [line.bounds for line in lines] == [(0, 0, 1, 1), (5, 5, 6, 6)]
+    
+    def test_load_uses_cache(self, tmp_path):
+        """Test the parsed cache is reused and refreshed when the file changes."""
+        path = tmp_path / "square.geo.json"
+        _write_square(path, 1.0)
+        first = GeoJSONLoader(path).load()
+        
+        cache_path = tmp_path / "square.geo.json.npz"
+        assert cache_path.exists()
+        assert [list(l.coords) for l in GeoJSONLoader(path).load()] == [
+            list(l.coords) for l in first
+        ]
+        
+        _write_square(path, 2.0)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        lines = GeoJSONLoader(path).load()
+        assert lines[0].bounds == (0.0, 0.0, 2.0, 2.0)
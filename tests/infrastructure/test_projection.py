@@ -1,7 +1,12 @@
 """Tests for projection implementations."""
 
+import math
+
 import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
+from geo_tui.infrastructure.projection._mercator_numba import project_batch, project_batch_numpy
 from geo_tui.infrastructure.projection.mercator_projection import MercatorProjection
 
 
@@ -19,8 +24,8 @@ class TestMercatorProjection:
         x, y = proj.project(0.0, 0.0)
         
         # Origin should project to approximately (0, 0) in Web Mercator
-        assert abs(x) < 1.0
-        assert abs(y) < 1.0
+        assert math.isclose(x, 0.0, abs_tol=1.0)
+        assert math.isclose(y, 0.0, abs_tol=1.0)
     
     def test_project_known_point(self):
         """Test projecting a known point."""
@@ -32,32 +37,63 @@ class TestMercatorProjection:
         assert -20000000 < x < 20000000
         assert 6000000 < y < 8000000
     
+    def test_project_clamps_poles(self):
+        """Test latitudes are clamped to the Web Mercator limit."""
+        proj = MercatorProjection()
+        x, y = proj.project(np.array([0.0, 0.0]), np.array([90.0, -90.0]))
+        
+        assert np.allclose(x, 0.0)
+        assert np.allclose(y, [20037508.34, -20037508.34])
+        assert proj.project(0.0, 90.0) == pytest.approx((0.0, 20037508.34))
+    
     def test_unproject_origin(self):
         """Test unprojecting origin."""
         proj = MercatorProjection()
         lon, lat = proj.unproject(0.0, 0.0)
         
         # Should be close to (0, 0)
-        assert abs(lon) < 0.1
-        assert abs(lat) < 0.1
+        assert math.isclose(lon, 0.0, abs_tol=0.1)
+        assert math.isclose(lat, 0.0, abs_tol=0.1)
     
-    def test_round_trip(self):
+    @pytest.mark.parametrize("lon,lat", [
+        (0.0, 0.0),
+        (45.0, 30.0),
+        (-120.0, 40.0),
+        (180.0, 0.0),
+    ])
+    def test_round_trip(self, projection, lon, lat):
         """Test round-trip projection."""
+        x, y = projection.project(lon, lat)
+        lon2, lat2 = projection.unproject(x, y)
+        
+        # Should be close to original (allowing for projection errors)
+        assert lon2 == pytest.approx(lon, abs=1e-4)
+        assert lat2 == pytest.approx(lat, abs=1e-4)
+    
+    @pytest.mark.parametrize(
+        "project", [project_batch, project_batch_numpy], ids=["default", "numpy"]
+    )
+    def test_round_trip_arrays(self, projection, project):
+        """Test round-trip projection of coordinate arrays."""
+        lons = np.array([0.0, 45.0, -120.0, 180.0])
+        lats = np.array([0.0, 30.0, 40.0, 0.0])
+        
+        xs, ys = project(lons, lats)
+        lon2, lat2 = projection.unproject(xs, ys)
+        
+        assert np.allclose(lons, lon2, atol=1e-4)
+        assert np.allclose(lats, lat2, atol=1e-4)
+    
+    def test_projection_from_other_thread(self):
+        """Test projecting and unprojecting from a worker thread matches the main thread."""
         proj = MercatorProjection()
+        x, y = proj.project(45.0, 30.0)
+        expected = proj.unproject(x, y)
         
-        # Test with various coordinates
-        test_points = [
-            (0.0, 0.0),
-            (45.0, 30.0),
-            (-120.0, 40.0),
-            (180.0, 0.0),
-        ]
-        
-        for lon, lat in test_points:
-            x, y = proj.project(lon, lat)
-            lon2, lat2 = proj.unproject(x, y)
-            
-            # Should be close to original (allowing for projection errors)
-            assert abs(lon - lon2) < 0.0001
-            assert abs(lat - lat2) < 0.0001
-
+        # unproject uses a per-thread pyproj transformer, built lazily here
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            projected = executor.submit(proj.project, 45.0, 30.0).result()
+            result = executor.submit(proj.unproject, x, y).result()
+        
+        assert projected == (x, y)
+        assert result == expected
@@ -1,10 +1,20 @@
 """Tests for rendering implementations."""
 
+import itertools
+import math
+
+import numpy as np
 import pytest
 import geopandas as gpd
 from shapely.geometry import LineString
 
-from geo_tui.infrastructure.rendering.braille_renderer import BrailleRenderer
+from geo_tui.infrastructure.rendering._braille_numba import (
+    encode_grid,
+    encode_grid_numpy,
+    rasterize_segments,
+    rasterize_segments_numpy,
+)
+from geo_tui.infrastructure.rendering.braille_renderer import BrailleRenderer, _clip_segments
 from geo_tui.domain.entities.viewport import Viewport
 
 
@@ -16,42 +26,172 @@ class TestBrailleRenderer:
         renderer = BrailleRenderer()
         assert renderer is not None
     
-    def test_render_empty_viewport(self):
+    def test_render_empty_viewport(self, empty_geoseries):
         """Test rendering with empty viewport."""
         renderer = BrailleRenderer()
         viewport = Viewport(0.0, 0.0, 1_000_000.0)
-        geometries = gpd.GeoSeries([], crs="EPSG:3857")
         
-        result = renderer.render(viewport, geometries, 80, 24)
+        result = renderer.render(viewport, empty_geoseries, 80, 24)
         
         assert isinstance(result, str)
     
-    def test_render_with_geometry(self):
+    def test_render_with_geometry(self, diag_line_geoseries):
         """Test rendering with a simple geometry."""
         renderer = BrailleRenderer()
         viewport = Viewport(0.0, 0.0, 1_000_000.0)
         
-        # Create a simple line geometry in Web Mercator
-        line = LineString([(-1000000, -1000000), (1000000, 1000000)])
-        geometries = gpd.GeoSeries([line], crs="EPSG:3857")
-        
-        result = renderer.render(viewport, geometries, 80, 24)
+        result = renderer.render(viewport, diag_line_geoseries, 80, 24)
         
         assert isinstance(result, str)
         assert len(result) > 0
+        
+        lines = result.split("\n")
+        assert len(lines) == 24
+        assert all(len(line) == 80 for line in lines)
     
-    def test_render_zero_size(self):
+    @pytest.mark.parametrize("width,height", [(0, 0), (0, 10), (10, 0)])
+    def test_render_zero_size(self, renderer, viewport, empty_geoseries, width, height):
         """Test rendering with zero size."""
+        assert renderer.render(viewport, empty_geoseries, width, height) == ""
+    
+    def test_render_reuses_simplified_geometries(self, diag_line_geoseries):
+        """Test panning at the same zoom level reuses simplified geometries."""
         renderer = BrailleRenderer()
-        viewport = Viewport(0.0, 0.0, 1_000_000.0)
-        geometries = gpd.GeoSeries([], crs="EPSG:3857")
+        geometries = diag_line_geoseries
+        line = geometries.iloc[0]
         
-        result = renderer.render(viewport, geometries, 0, 0)
-        assert result == ""
+        renderer.render(Viewport(0.0, 0.0, 50_000.0), geometries, 80, 24)
+        renderer.render(Viewport(10_000.0, 0.0, 50_000.0), geometries, 80, 24)
+        assert len(renderer._simplify_cache) == 1
         
-        result = renderer.render(viewport, geometries, 0, 10)
-        assert result == ""
+        renderer.render(Viewport(0.0, 0.0, 5_000.0), geometries, 80, 24)
+        assert len(renderer._simplify_cache) == 2
         
-        result = renderer.render(viewport, geometries, 10, 0)
-        assert result == ""
-
+        other = gpd.GeoSeries([line], crs=geometries.crs)
+        renderer.render(Viewport(0.0, 0.0, 5_000.0), other, 80, 24)
+        assert len(renderer._simplify_cache) == 1
+    
+    def test_render_simplifies_only_visible_lines(self, empty_geoseries):
+        """Test a new zoom level only simplifies the lines in view."""
+        renderer = BrailleRenderer()
+        visible = LineString([(-1000000, -500000), (1000000, 500000)])
+        offscreen = LineString([(9000000, 9000000), (9500000, 9500000)])
+        geometries = gpd.GeoSeries([offscreen, visible], crs=empty_geoseries.crs)
+        
+        renderer.render(Viewport(0.0, 0.0, 50_000.0), geometries, 80, 24)
+        
+        (simplified,) = renderer._simplify_cache.values()
+        assert simplified[0] is None
+        assert simplified[1] is not None
+    
+    @pytest.mark.parametrize(
+        "rasterize", [rasterize_segments, rasterize_segments_numpy], ids=["default", "numpy"]
+    )
+    def test_rasterize_segments(self, rasterize):
+        """Test clipped segments are drawn as braille dots."""
+        grid = np.zeros((2, 2), dtype=np.uint8)
+        p0, p1 = _clip_segments(
+            np.array([[0.0, 0.0], [-10.0, 7.0], [-5.0, -5.0]]),
+            np.array([[3.0, 0.0], [10.0, 7.0], [-1.0, 20.0]]),
+            3, 7
+        )
+        
+        skip_start = np.zeros(len(p0), dtype=np.uint8)
+        rasterize(grid, p0.astype(np.int32), p1.astype(np.int32), skip_start, 4, 8)
+        
+        # Top dots of the first row, bottom dots of the second row
+        assert grid.tolist() == [[1 | 8, 1 | 8], [64 | 128, 64 | 128]]
+    
+    def test_clip_segments(self):
+        """Test segments are clipped to the rectangle or dropped."""
+        p0, p1 = _clip_segments(
+            np.array([[-10.0, 5.0], [2.0, 2.0], [20.0, 0.0]]),
+            np.array([[30.0, 5.0], [4.0, 6.0], [30.0, 10.0]]),
+            10, 10
+        )
+        
+        segments = sorted(zip(p0.tolist(), p1.tolist()))
+        assert segments == [([0.0, 5.0], [10.0, 5.0]), ([2.0, 2.0], [4.0, 6.0])]
+    
+    def test_render_ignores_offscreen_geometries(self, empty_geoseries):
+        """Test geometries outside the viewport do not change the frame."""
+        renderer = BrailleRenderer()
+        viewport = Viewport(0.0, 0.0, 50_000.0)
+        visible = LineString([(-1000000, -500000), (1000000, 500000)])
+        offscreen = LineString([(9000000, 9000000), (9500000, 9500000)])
+        
+        expected = renderer.render(
+            viewport, gpd.GeoSeries([visible], crs=empty_geoseries.crs), 80, 24
+        )
+        result = renderer.render(
+            viewport, gpd.GeoSeries([offscreen, visible], crs=empty_geoseries.crs), 80, 24
+        )
+        
+        assert result.strip()
+        assert result == expected
+    
+    @pytest.mark.parametrize("encode", [encode_grid, encode_grid_numpy], ids=["default", "numpy"])
+    def test_encode_grid(self, encode):
+        """Test the grid is encoded as UTF-8 braille text."""
+        grid = np.array([[0, 1], [255, 0]], dtype=np.uint8)
+        
+        assert encode(grid).tobytes().decode("utf-8") == " \u2801\n\u28ff "
+    
+    @pytest.mark.benchmark
+    def test_render_many_lines_perf(self, benchmark, renderer, viewport, empty_geoseries):
+        """Test panning across a large GeoSeries stays within the frame budget."""
+        if benchmark.disabled:
+            pytest.skip("benchmarks are not timed under xdist; run with -n 0")
+        
+        rng = np.random.default_rng(0)
+        starts = rng.uniform(-2e7, 2e7, size=(10_000, 2))
+        lines = gpd.GeoSeries(
+            [LineString([start, start + offset]) for start, offset in
+             zip(starts, rng.uniform(-2e5, 2e5, size=(10_000, 2)))],
+            crs=empty_geoseries.crs
+        )
+        viewport.meters_per_pixel = 20_000.0
+        renderer.render(viewport, lines, 120, 40)
+        
+        # Pan east and back while zooming, so every frame sees new bounds
+        steps = itertools.cycle([(1_000_000.0, 1.25)] * 4 + [(-1_000_000.0, 0.8)] * 4)
+        
+        def pan_and_zoom():
+            delta_x, factor = next(steps)
+            viewport.pan(delta_x, 0.0)
+            viewport.zoom(factor)
+            return renderer.render(viewport, lines, 120, 40)
+        
+        result = benchmark(pan_and_zoom)
+        
+        assert len(result.split("\n")) == 40
+        assert benchmark.stats.stats.median < 0.05
+    
+    @pytest.mark.benchmark
+    def test_zoom_uncached_scales_perf(self, benchmark, viewport, empty_geoseries):
+        """Test zooming to scales without simplified geometries stays within the frame budget."""
+        if benchmark.disabled:
+            pytest.skip("benchmarks are not timed under xdist; run with -n 0")
+        
+        rng = np.random.default_rng(0)
+        starts = rng.uniform(-2e6, 2e6, size=(2_000, 1, 2))
+        walks = rng.normal(0.0, 2e3, size=(2_000, 500, 2)).cumsum(axis=1)
+        lines = gpd.GeoSeries(
+            [LineString(coords) for coords in starts + walks], crs=empty_geoseries.crs
+        )
+        renderer = BrailleRenderer()
+        
+        # One zoom step apart and more scales than the cache holds, so
+        # every frame simplifies its lines again
+        scales = itertools.cycle(20_000.0 * 0.8 ** np.arange(24))
+        
+        def zoom():
+            viewport.meters_per_pixel = next(scales)
+            bucket = round(math.log2(viewport.meters_per_pixel), 1)
+            assert bucket not in renderer._simplify_cache
+            return renderer.render(viewport, lines, 120, 40)
+        
+        result = benchmark(zoom)
+        
+        assert len(result.split("\n")) == 40
+        assert benchmark.stats.stats.median < 0.03
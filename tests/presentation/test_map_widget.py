@@ -0,0 +1,60 @@
+"""Tests for the map widget."""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+from textual.app import App
+
+from geo_tui.application.services.navigation_service import NavigationService
+from geo_tui.presentation.widgets.map_widget import MapWidget
+
+
+class MapWidgetApp(App):
+    """Minimal app hosting a single map widget."""
+    
+    def __init__(self, map_service, viewport):
+        super().__init__()
+        self.map_widget = MapWidget(map_service, NavigationService(viewport), viewport)
+    
+    def compose(self):
+        yield self.map_widget
+
+
+class TestMapWidget:
+    """Test suite for MapWidget."""
+    
+    def test_pan_keeps_previous_frame_while_rendering(self, viewport):
+        """Test panning shows the previous frame until the new one is rendered."""
+        render_allowed = threading.Event()
+        render_allowed.set()
+        
+        def render(view, width, height):
+            render_allowed.wait(timeout=5)
+            return f"frame at {view.center_x:.0f}"
+        
+        map_service = Mock(render=Mock(side_effect=render))
+        app = MapWidgetApp(map_service, viewport)
+        
+        async def run():
+            async with app.run_test(size=(40, 10)) as pilot:
+                widget = app.map_widget
+                await pilot.pause(0.2)
+                first_frame = widget.render()
+                
+                render_allowed.clear()
+                try:
+                    await pilot.press("d")
+                    await pilot.pause(0.2)
+                    during_render = widget.render()
+                finally:
+                    render_allowed.set()
+                await pilot.pause(0.2)
+                return first_frame, during_render, widget.render()
+        
+        first_frame, during_render, after_render = asyncio.run(run())
+        
+        assert first_frame == "frame at 0"
+        assert during_render == first_frame
+        assert after_render == f"frame at {viewport.center_x:.0f}"
+        assert after_render != first_frame